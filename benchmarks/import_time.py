@@ -0,0 +1,79 @@
+"""匯入時間基準測試 | Import-time benchmark.
+
+量測 `import paratranz_py` 與建立 `ParaTranz().projects` 的時間，並確認重量級相依套件
+仍維持延遲載入。超出預算或載入了不該載入的模組時以非零狀態碼結束，可作為 pre-commit hook。
+Measures `import paratranz_py` and `ParaTranz().projects` in fresh interpreters and
+checks that heavy dependencies stay lazy. Exits non-zero when over budget or when a
+module is imported too early, so it can run as a pre-commit hook.
+
+Usage:
+    python benchmarks/import_time.py [--runs 10] [--budget-ms 50]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 各階段不應載入的模組 | Modules that must not be loaded at each stage
+STAGES = {
+    "import": (
+        "import paratranz_py",
+        ["requests", "loguru", "pooch", "paratranz_py.main"],
+    ),
+    "projects": (
+        "import paratranz_py; paratranz_py.ParaTranz('token').projects",
+        ["pooch", "paratranz_py.api.artifacts"],
+    ),
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec({code!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [m for m in {banned!r} if m in sys.modules]}}))
+"""
+
+
+def measure(code: str, banned: list) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(code=code, banned=banned)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    failed = False
+    for stage, (code, banned) in STAGES.items():
+        samples = [measure(code, banned) for _ in range(args.runs)]
+        median = statistics.median(sample["ms"] for sample in samples)
+        loaded = sorted({name for sample in samples for name in sample["loaded"]})
+        print(f"{stage:<10} median {median:8.2f} ms over {args.runs} runs")
+
+        if loaded:
+            print(f"  FAIL: eagerly imported {', '.join(loaded)}")
+            failed = True
+        if stage == "import" and args.budget_ms and median > args.budget_ms:
+            print(f"  FAIL: over budget of {args.budget_ms} ms")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
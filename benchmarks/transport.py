@@ -0,0 +1,72 @@
+"""傳輸層基準測試 | Transport benchmark.
+
+以不同傳輸層並行送出 `Projects.get_project`，比較延遲與總時間。
+Sends concurrent `Projects.get_project` calls through each transport and
+compares latency and wall-clock time.
+
+Usage:
+    PARATRANZ_TOKEN=... python benchmarks/transport.py --project-id 1234 \\
+        [--requests 200] [--concurrency 32] [--transports requests,httpx]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from paratranz_py import ParaTranz  # noqa: E402
+
+
+def run(transport: str, args) -> dict:
+    client = ParaTranz(
+        os.environ.get("PARATRANZ_TOKEN"), api_url=args.api_url, transport=transport
+    )
+    projects = client.projects
+
+    def call(_) -> float:
+        start = time.perf_counter()
+        projects.get_project(args.project_id)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        latencies = sorted(executor.map(call, range(args.requests)))
+    total = time.perf_counter() - start
+
+    return {
+        "transport": transport,
+        "total": total,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "rps": args.requests / total,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--project-id", type=int, required=True)
+    parser.add_argument("--api-url", default=None)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--transports", default="requests,httpx")
+    args = parser.parse_args()
+
+    print(f"{'transport':<10} {'total s':>8} {'p50 ms':>8} {'p95 ms':>8} {'req/s':>8}")
+    for transport in args.transports.split(","):
+        result = run(transport, args)
+        print(
+            f"{result['transport']:<10} {result['total']:8.2f}"
+            f" {result['p50'] * 1000:8.1f} {result['p95'] * 1000:8.1f}"
+            f" {result['rps']:8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,11 @@
-from .main import ParaTranz
-
 __all__ = ["ParaTranz"]
+
+
+def __getattr__(name: str):
+    # 延遲載入，避免 `import paratranz_py` 時載入 requests 與 loguru 等相依套件
+    # Imported lazily so `import paratranz_py` does not pull in requests, loguru, etc.
+    if name == "ParaTranz":
+        from .main import ParaTranz
+
+        return ParaTranz
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
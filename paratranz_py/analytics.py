@@ -0,0 +1,222 @@
+from array import array
+from collections import Counter
+from datetime import date
+from loguru import logger
+from typing import Iterable
+
+from .utils.pagination import iter_pages
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+_MISSING = -1
+
+
+class ContributorAnalytics:
+    """
+    以欄式緩衝區彙整專案歷史記錄的貢獻統計
+    Aggregate contribution metrics from project history in columnar buffers.
+
+    歷史記錄會被壓縮為整數欄位 (uid、日期、檔案 ID)，有 NumPy 時以向量化方式分組計算。
+    History records are packed into integer columns (uid, day, file ID) and
+    grouped with vectorized operations when NumPy is available.
+    """
+
+    def __init__(self):
+        self._ids = array("q")
+        self._uids = array("q")
+        self._days = array("l")
+        self._files = array("q")
+        self._seen = set()
+        # 尚未完整抓取到最舊一頁時，從這一頁繼續 | Page to resume from until the oldest page is reached once
+        self._resume_page = 1
+        self._complete = False
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add_records(self, records: Iterable[dict]) -> int:
+        """加入歷史記錄 (重複的記錄會被略過) | Add history records (duplicates are skipped).
+
+        Args:
+            records (Iterable[dict]):
+                `History.get_history` 回應中的 `results` | The `results` of a `History.get_history` response
+
+        Returns:
+            int:
+                新加入的記錄數 | Number of newly added records
+        """
+        added = 0
+        for record in records:
+            record_id = record.get("id")
+            if record_id in self._seen:
+                continue
+            self._seen.add(record_id)
+            self._ids.append(record_id)
+            self._uids.append(record.get("uid") or _MISSING)
+            self._days.append(_day_of(record.get("createdAt")))
+            self._files.append(_file_of(record))
+            added += 1
+        return added
+
+    def update(self, history, project_id: int, page_size: int = 800) -> int:
+        """從最新頁開始抓取，直到遇到已處理的記錄 | Fetch from the newest page until known records are reached.
+
+        在第一次完整抓取到最舊一頁之前，會從上次中斷的頁面繼續抓取較舊的記錄，
+        避免中斷或頁面位移導致遺漏。
+        Until the oldest page has been reached once, older records are then
+        fetched from where the last run stopped, so an interrupted first crawl
+        or shifting pages leave no gaps.
+
+        Args:
+            history (History):
+                History API 實例 | The History API instance
+            project_id (int):
+                專案 ID | Project ID
+            page_size (int):
+                每頁數量 | Number of items per page (default: 800)
+
+        Returns:
+            int:
+                新加入的記錄數 | Number of newly added records
+        """
+        added = 0
+        contiguous = True
+        for data in iter_pages(history.get_history, project_id, page_size=page_size):
+            results = data.get("results", [])
+            page_added = self.add_records(results)
+            added += page_added
+            if page_added < len(results):
+                contiguous = False
+                break
+            page = data.get("page", 1)
+            # 新記錄只會把舊記錄往後推，已完整抓取的頁面不會被跳過
+            # New records only push old ones back, so pages read in full stay covered
+            self._resume_page = max(self._resume_page, page)
+            if page >= data.get("pageCount", 0):
+                self._complete = True
+
+        if not self._complete and not contiguous:
+            for data in iter_pages(
+                history.get_history,
+                project_id,
+                page_size=page_size,
+                start_page=self._resume_page,
+            ):
+                added += self.add_records(data.get("results", []))
+                page = data.get("page", self._resume_page)
+                self._resume_page = page
+                if page >= data.get("pageCount", 0):
+                    self._complete = True
+        logger.info(f"Added {added} history records of project {project_id}.")
+        return added
+
+    def per_user(self) -> dict:
+        """每位使用者的貢獻數 | Contributions per user.
+
+        Returns:
+            dict:
+                uid 對應貢獻數 | Contribution count keyed by uid
+        """
+        return _group_count(self._uids)
+
+    def per_day(self) -> dict:
+        """每日的貢獻數 | Contributions per day.
+
+        Returns:
+            dict:
+                日期 (ISO 格式) 對應貢獻數 | Contribution count keyed by ISO date
+        """
+        return {
+            date.fromordinal(day).isoformat(): count
+            for day, count in _group_count(self._days).items()
+        }
+
+    def per_file(self) -> dict:
+        """每個檔案的貢獻數 | Contributions per file.
+
+        Returns:
+            dict:
+                檔案 ID 對應貢獻數 | Contribution count keyed by file ID
+        """
+        return _group_count(self._files)
+
+    def per_user_day(self) -> dict:
+        """每位使用者每日的貢獻數 | Contributions per user and day.
+
+        Returns:
+            dict:
+                (uid, ISO 日期) 對應貢獻數 | Contribution count keyed by (uid, ISO date)
+        """
+        if np is not None and len(self):
+            uids = np.frombuffer(self._uids, dtype=np.int64)
+            days = np.frombuffer(self._days, dtype=self._days.typecode)
+            pairs, counts = np.unique(
+                np.stack((uids, days.astype(np.int64)), axis=1),
+                axis=0,
+                return_counts=True,
+            )
+            grouped = zip(map(tuple, pairs.tolist()), counts.tolist())
+        else:
+            grouped = Counter(zip(self._uids, self._days)).items()
+        return {
+            (uid, date.fromordinal(day).isoformat()): count
+            for (uid, day), count in grouped
+            if uid != _MISSING and day != _MISSING
+        }
+
+    def leaderboard(self, scores: list = None, members: list = None) -> list:
+        """結合成員與貢獻分數產生排行榜 | Build a leaderboard combined with members and scores.
+
+        Args:
+            scores (list):
+                `Scores.get_scores` 的回應 | The `Scores.get_scores` response
+            members (list):
+                `Members.get_members` 的回應 | The `Members.get_members` response
+
+        Returns:
+            list:
+                依貢獻數排序的使用者資訊 | User entries sorted by contribution count
+        """
+        users = {}
+        for member in members or []:
+            users.setdefault(member.get("uid"), {}).update(
+                user=member.get("user"), permission=member.get("permission")
+            )
+        for score in scores or []:
+            users.setdefault(score.get("uid"), {}).update(score=score)
+
+        board = []
+        for uid, count in self.per_user().items():
+            board.append({"uid": uid, "contributions": count, **users.get(uid, {})})
+        board.sort(key=lambda entry: entry["contributions"], reverse=True)
+        return board
+
+
+def _group_count(column: array) -> dict:
+    if np is not None and len(column):
+        values, counts = np.unique(
+            np.frombuffer(column, dtype=column.typecode), return_counts=True
+        )
+        grouped = zip(values.tolist(), counts.tolist())
+    else:
+        grouped = Counter(column).items()
+    return {value: count for value, count in grouped if value != _MISSING}
+
+
+def _day_of(created_at: str) -> int:
+    try:
+        return date.fromisoformat(created_at[:10]).toordinal()
+    except (TypeError, ValueError):
+        return _MISSING
+
+
+def _file_of(record: dict) -> int:
+    target = record.get("target") or {}
+    file = target.get("file", record.get("file"))
+    if isinstance(file, dict):
+        file = file.get("id")
+    return file if isinstance(file, int) else _MISSING
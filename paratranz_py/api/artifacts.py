@@ -1,7 +1,13 @@
+import os
+
 from pathlib import Path
 from loguru import logger
+from typing import TYPE_CHECKING, List, Optional, Union
+
 from .base import ParaTranzAPI
-from pooch import retrieve, HTTPDownloader, Unzip
+
+if TYPE_CHECKING:
+    from ..utils.zipdelta import ArchiveDelta
 
 
 class Artifacts(ParaTranzAPI):
@@ -48,7 +54,7 @@ class Artifacts(ParaTranzAPI):
         path: Path = None,
         artifact_name: str = "artifact.zip",
         extract_path: Path = None,
-    ):
+    ) -> Optional[Union[str, List[str]]]:
         """獲取 Artifacts 下載連結 | Get Artifacts download URL
 
         Args:
@@ -60,7 +66,14 @@ class Artifacts(ParaTranzAPI):
                 Artifacts 檔案名稱 | Artifacts file name (default: "artifact.zip")
             extract_path (Path):
                 解壓縮路徑 | Extract path
+
+        Returns:
+            str | list:
+                下載的檔案路徑；指定 `extract_path` 時為解壓縮後的檔案路徑列表；失敗時為 None |
+                Path of the downloaded file; the list of extracted file paths when `extract_path` is given; None on failure
         """
+        from pooch import retrieve, HTTPDownloader, Unzip
+
         artifacts_url = f"{self._projects_url}/{project_id}/artifacts/download"
 
         if extract_path is not None:
@@ -70,7 +83,7 @@ class Artifacts(ParaTranzAPI):
             extract_dir_path = None
 
         try:
-            retrieve(
+            return retrieve(
                 url=artifacts_url,
                 path=path,
                 fname=artifact_name,
@@ -80,3 +93,52 @@ class Artifacts(ParaTranzAPI):
             )
         except Exception as e:
             logger.error(f"Download Failed! Error: {str(e)}")
+
+    def download_artifacts_delta(
+        self,
+        project_id: str,
+        path: Path,
+        extract_path: Path,
+        artifact_name: str = "artifact.zip",
+        prune: bool = True,
+    ) -> Optional["ArchiveDelta"]:
+        """下載 Artifacts 並只解壓縮與上次下載不同的檔案 | Download Artifacts and extract only the files that changed since the last download.
+
+        以 ZIP 中央目錄的名稱、大小與 CRC32 和 `path` 中的上一個檔案比較，
+        未變更的檔案不會被解壓縮。完成後新檔案會取代上一個檔案。
+        Compares the names, sizes and CRC32 in the ZIP central directory with
+        the previous archive in `path`, so unchanged files are never
+        decompressed. The new archive then replaces the previous one.
+
+        Args:
+            project_id (str):
+                專案 ID | Project ID
+            path (Path):
+                儲存檔案的路徑 | Path to save the file
+            extract_path (Path):
+                解壓縮路徑 | Extract path
+            artifact_name (str):
+                Artifacts 檔案名稱 | Artifacts file name (default: "artifact.zip")
+            prune (bool):
+                刪除已不在 Artifacts 中的檔案 | Delete files no longer in the Artifacts (default: True)
+
+        Returns:
+            ArchiveDelta:
+                新增、修改與移除的檔案名稱，下載失敗時為 None | Names of the added, modified and removed files, or None if the download failed
+        """
+        from ..utils.zipdelta import apply_delta, diff_archives
+
+        previous = Path(path) / artifact_name
+        # pooch 不會重新下載已存在的檔案 | pooch skips files that already exist
+        partial = previous.with_name(f"{artifact_name}.part")
+        partial.unlink(missing_ok=True)
+
+        # 不指定 extract_path，回傳值才是 ZIP 檔路徑 | Without extract_path the result is the archive path
+        downloaded = self.download_artifacts(project_id, path, partial.name)
+        if downloaded is None:
+            return None
+
+        delta = diff_archives(previous, downloaded)
+        apply_delta(downloaded, delta, extract_path, prune=prune)
+        os.replace(downloaded, previous)
+        return delta
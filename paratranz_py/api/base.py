@@ -1,11 +1,31 @@
+import json
+import time
 import requests
 
 from loguru import logger
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Tuple, Union
+
+from ..utils.deadline import current_deadline
+from .transport import RequestsTransport, Transport
+
+if TYPE_CHECKING:
+    from ..utils.adaptive import AdaptiveConcurrencyLimiter
+    from ..utils.hedging import Hedger
+    from ..utils.singleflight import SingleFlight
+    from ..wal import WriteAheadQueue
 
 
 class ParaTranzAPI:
-    def __init__(self, api_headers: dict, api_url: str):
+    def __init__(
+        self,
+        api_headers: dict,
+        api_url: str,
+        write_queue: "WriteAheadQueue" = None,
+        single_flight: "SingleFlight" = None,
+        transport: Transport = None,
+        limiter: "AdaptiveConcurrencyLimiter" = None,
+        hedger: "Hedger" = None,
+    ):
         """Base class for ParaTranz API.
 
         Args:
@@ -13,47 +33,153 @@ class ParaTranzAPI:
                 The API headers.
             api_url (str):
                 The base API URL.
+            write_queue (WriteAheadQueue):
+                Optional write-ahead queue that records mutations before sending them.
+            single_flight (SingleFlight):
+                Optional group that coalesces identical concurrent GET requests.
+            transport (Transport):
+                The HTTP transport (default: a new `RequestsTransport`). The API
+                headers are added to a given transport.
+            limiter (AdaptiveConcurrencyLimiter):
+                Optional limiter shared by all requests that adapts concurrency to the server.
+            hedger (Hedger):
+                Optional hedger that duplicates slow GET requests.
         """
         self._api_headers = api_headers
         self._api_url = api_url
+        self._write_queue = write_queue
+        self._single_flight = single_flight
 
-        self.session = requests.Session()
-        self.session.headers.update(self._api_headers)
+        if transport is not None:
+            transport.update_headers(self._api_headers)
+        self._transport = transport or RequestsTransport(self._api_headers)
+        self.session = getattr(self._transport, "session", None)
+        self._limiter = limiter
+        self._hedger = hedger
 
     def _request(
         self,
         method: str,
         url: str,
         return_status: bool = False,
+        return_content: bool = False,
         timeout: int = 10,
         **kwargs,
-    ) -> Optional[Union[int, dict, list, str]]:
+    ) -> Optional[Union[int, dict, list, str, bytes]]:
         """General API request method.
 
         Args:
             method (str): HTTP method (GET, POST, PUT, DELETE).
             url (str): API request URL.
             return_status (bool): Whether to return the HTTP status code (default: False).
+            return_content (bool): Whether to return the raw response body (default: False).
             timeout (int): Timeout for the request in seconds (default: 10).
             kwargs: Other `requests` parameters, such as json, data, params, etc.
 
         Returns:
             - If `return_status=True`, returns the HTTP status code (int).
-            - If `return_status=False`, returns the JSON response (dict | list).
+            - If `return_content=True`, returns the raw response body (bytes).
+            - Otherwise, returns the JSON response (dict | list).
             - On failure, returns the response text (str) or None.
+            - If the mutation was deferred to the write-ahead queue, returns None.
         """
+        entry_id = None
+        if self._write_queue is not None and method.upper() != "GET":
+            entry_id = self._write_queue.append(method, url, kwargs)
+            if self._write_queue.deferred:
+                return None
+            deadline = current_deadline()
+            self._write_queue.wait_turn(
+                entry_id, url, deadline.remaining() if deadline is not None else None
+            )
+
+        def send():
+            return self._send(method, url, timeout=timeout, **kwargs)
+
+        if method.upper() == "GET" and self._hedger is not None:
+            fetch = send
+
+            def send():
+                return self._hedger.run(fetch)
+
+        if method.upper() == "GET" and self._single_flight is not None:
+            key = (url, json.dumps(kwargs, sort_keys=True, default=str))
+            response = self._single_flight.do(key, send)
+        else:
+            response = send()
+        if response is None:
+            if entry_id is not None:
+                self._write_queue.release(entry_id)
+            return None
+
+        if entry_id is not None:
+            self._write_queue.ack(entry_id)
+
+        if return_status:
+            return response.status_code
+
+        if return_content:
+            return response.content
+
         try:
-            response = self.session.request(method, url, timeout=timeout, **kwargs)
-            response.raise_for_status()
+            return response.json()
+        except ValueError:
+            logger.error(f"Invalid JSON response from {url}: {response.text}")
+            return response.text
 
-            if return_status:
-                return response.status_code
+    def _send(
+        self, method: str, url: str, timeout: int = 10, **kwargs
+    ) -> Optional[requests.Response]:
+        """Send a request and check its status.
 
-            try:
-                return response.json()
-            except ValueError:
-                logger.error(f"Invalid JSON response from {url}: {response.text}")
-                return response.text
+        Args:
+            method (str): HTTP method (GET, POST, PUT, DELETE).
+            url (str): API request URL.
+            timeout (int): Timeout for the request in seconds (default: 10).
+            kwargs: Other `requests` parameters, such as json, data, params, etc.
+
+        Returns:
+            The successful response, or None on failure.
+        """
+        return self._exchange(method, url, timeout=timeout, **kwargs)[0]
+
+    def _exchange(
+        self, method: str, url: str, timeout: int = 10, **kwargs
+    ) -> Tuple[Optional[requests.Response], Optional[int]]:
+        """Send a request and return the successful response with its status code.
+
+        Returns:
+            (response, status): The response is None on failure; the status is
+            None when no response arrived (timeout, connection error or deadline).
+        """
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired:
+            logger.error(f"Deadline exceeded before: {method} {url}")
+            return None, None
+
+        if self._limiter is not None and not self._limiter.acquire(
+            deadline.remaining() if deadline is not None else None
+        ):
+            logger.error(f"Deadline exceeded waiting for a slot: {method} {url}")
+            return None, None
+
+        # 等待並行額度的時間也計入期限 | Time spent waiting for a slot counts against the deadline
+        if deadline is not None:
+            remaining = deadline.remaining()
+            if remaining <= 0:
+                if self._limiter is not None:
+                    self._limiter.cancel()
+                logger.error(f"Deadline exceeded waiting for a slot: {method} {url}")
+                return None, None
+            timeout = min(timeout, remaining)
+
+        start = time.monotonic()
+        status = None
+        try:
+            response = self._transport.request(method, url, timeout=timeout, **kwargs)
+            status = response.status_code
+            response.raise_for_status()
+            return response, status
 
         except requests.Timeout:
             logger.error(f"Request timed out: {method} {url}")
@@ -63,5 +189,8 @@ class ParaTranzAPI:
             logger.error(f"HTTP error on: {method} {str(e)}")
         except requests.RequestException as e:
             logger.error(f"Unexpected error during {method} {url}: {str(e)}")
+        finally:
+            if self._limiter is not None:
+                self._limiter.release(time.monotonic() - start, status)
 
-        return None
+        return None, status
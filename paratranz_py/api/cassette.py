@@ -0,0 +1,172 @@
+import base64
+import hashlib
+import json
+import random
+import threading
+import time
+
+import requests
+
+from collections import defaultdict
+from pathlib import Path
+from loguru import logger
+from requests.structures import CaseInsensitiveDict
+
+from ..utils.compression import read_bytes, write_bytes
+from .transport import RequestsTransport, Transport
+
+
+class CassetteTransport(Transport):
+    """
+    錄製與重播 HTTP 請求的傳輸層，可離線進行負載測試
+    Transport that records and replays HTTP exchanges for offline load testing.
+
+    錄製模式透過內層傳輸層送出請求並記下回應；重播模式依相同請求的錄製順序回傳回應，
+    並可模擬延遲與伺服器並行上限。
+    Record mode sends requests through an inner transport and stores the
+    responses. Replay mode serves the recorded responses for identical
+    requests in recorded order, with optional synthetic latency and a
+    server-side concurrency cap.
+    """
+
+    name = "cassette"
+
+    def __init__(
+        self,
+        path: Path,
+        mode: str = "replay",
+        inner: Transport = None,
+        headers: dict = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        max_concurrency: int = None,
+        seed: int = 0,
+    ):
+        """初始化錄製帶 | Initialize the cassette.
+
+        Args:
+            path (Path):
+                錄製檔路徑 (.zst 或 .gz 副檔名會壓縮儲存) | Cassette path (a .zst or .gz suffix stores it compressed)
+            mode (str):
+                模式 | Mode (default: "replay")
+                    record: 錄製 | Record
+                    replay: 重播 | Replay
+            inner (Transport):
+                錄製時實際送出請求的傳輸層 | Transport used to send requests when recording (default: `RequestsTransport`)
+            headers (dict):
+                建立預設內層傳輸層時使用的標頭 | Headers for the default inner transport
+            latency (float):
+                重播時每個請求的模擬延遲秒數 | Synthetic latency per replayed request in seconds (default: 0.0)
+            jitter (float):
+                額外的隨機延遲上限秒數 | Upper bound of extra random latency in seconds (default: 0.0)
+            max_concurrency (int):
+                模擬伺服器同時處理的請求上限 | Simulated server concurrency cap (default: None, unlimited)
+            seed (int):
+                隨機延遲的種子 | Seed for the random latency (default: 0)
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self.jitter = jitter
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._slots = threading.Semaphore(max_concurrency) if max_concurrency else None
+        self._entries = []
+        self._cursors = defaultdict(int)
+        self._recorded = defaultdict(list)
+
+        if mode == "record":
+            self._inner = inner or RequestsTransport(headers)
+        else:
+            self._inner = None
+            for line in read_bytes(self.path).splitlines():
+                entry = json.loads(line)
+                self._recorded[entry["key"]].append(entry)
+            logger.info(f"Loaded {sum(map(len, self._recorded.values()))} exchanges.")
+
+    def request(
+        self, method: str, url: str, timeout: float = 10, **kwargs
+    ) -> requests.Response:
+        key = _request_key(method, url, kwargs)
+
+        if self.mode == "record":
+            response = self._inner.request(method, url, timeout=timeout, **kwargs)
+            entry = {
+                "key": key,
+                "method": method,
+                "url": url,
+                "status": response.status_code,
+                "reason": response.reason,
+                "content_type": response.headers.get("Content-Type"),
+                "content": base64.b64encode(response.content).decode("ascii"),
+            }
+            with self._lock:
+                self._entries.append(entry)
+            return response
+
+        with self._lock:
+            entries = self._recorded.get(key)
+            if not entries:
+                raise requests.ConnectionError(f"No recorded response: {method} {url}")
+            # 依錄製順序回傳，用完後重複最後一筆 | Served in order, repeating the last one
+            entry = entries[min(self._cursors[key], len(entries) - 1)]
+            self._cursors[key] += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+
+        if self._slots is not None:
+            with self._slots:
+                time.sleep(delay)
+        elif delay:
+            time.sleep(delay)
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.url = entry["url"]
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": entry["content_type"]} if entry["content_type"] else {}
+        )
+        response.encoding = "utf-8"
+        response._content = base64.b64decode(entry["content"])
+        return response
+
+    def update_headers(self, headers: dict):
+        # 只有錄製時會送出請求 | Only recording sends requests
+        if self._inner is not None:
+            self._inner.update_headers(headers)
+
+    def save(self):
+        """寫出錄製內容 | Write the recorded exchanges."""
+        if self.mode != "record":
+            return
+        with self._lock:
+            lines = [json.dumps(entry, ensure_ascii=False) for entry in self._entries]
+        write_bytes(self.path, "\n".join(lines).encode())
+        logger.info(f"Saved {len(lines)} exchanges to {self.path}.")
+
+    def close(self):
+        self.save()
+        if self._inner is not None:
+            self._inner.close()
+
+
+def _request_key(method: str, url: str, kwargs: dict) -> str:
+    params = {
+        key: value
+        for key, value in (kwargs.get("params") or {}).items()
+        if value is not None
+    }
+    body = hashlib.sha1()
+    for name in ("json", "data"):
+        if kwargs.get(name) is not None:
+            body.update(json.dumps(kwargs[name], sort_keys=True, default=str).encode())
+    for field, upload in (kwargs.get("files") or {}).items():
+        body.update(field.encode())
+        if isinstance(upload, tuple):
+            body.update(upload[1] if isinstance(upload[1], bytes) else b"")
+    return "{} {} {} {}".format(
+        method.upper(), url, json.dumps(params, sort_keys=True), body.hexdigest()
+    )
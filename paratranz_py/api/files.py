@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Union
 from loguru import logger
 from .base import ParaTranzAPI
 
@@ -115,7 +116,9 @@ class Files(ParaTranzAPI):
             return_status=True,
         )
 
-    def get_translation_file(self, project_id: int, file_id: int) -> list:
+    def get_translation_file(
+        self, project_id: int, file_id: int, raw: bool = False
+    ) -> Union[list, bytes]:
         """獲取翻譯檔案 | Get the translation file.
 
         Args:
@@ -123,13 +126,17 @@ class Files(ParaTranzAPI):
                 專案 ID | The project ID
             file_id (int):
                 檔案 ID | The file ID
+            raw (bool):
+                回傳未解析的 JSON 內容 | Return the unparsed JSON body (default: False)
 
         Returns:
-            list:
+            list | bytes:
                 翻譯檔案 | The translation
         """
         return self._request(
-            "GET", f"{self._projects_url}/{project_id}/files/{file_id}/translation"
+            "GET",
+            f"{self._projects_url}/{project_id}/files/{file_id}/translation",
+            return_content=raw,
         )
 
     def update_translation_file(
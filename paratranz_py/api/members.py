@@ -1,6 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
+from typing import Dict, Union
+
+from ..utils.adaptive import pool_size
+from ..utils.deadline import bind_context
+from ..utils.ratelimit import RateLimiter
 from .base import ParaTranzAPI
 
+# 可透過 API 指派的權限 | Permissions that can be assigned through the API
+_ASSIGNABLE = (1, 2, 3)
+
 
 class Members(ParaTranzAPI):
     """
@@ -103,3 +112,181 @@ class Members(ParaTranzAPI):
         """
         member_url = f"{self._projects_url}/{project_id}/members/{member_id}"
         return self._request("DELETE", member_url, return_status=True)
+
+    def sync_members(
+        self,
+        project_id: int,
+        roster: Dict[int, Union[int, dict]],
+        remove: bool = True,
+        max_workers: int = 4,
+        rate_limit: float = 5.0,
+    ) -> dict:
+        """依名冊同步專案成員 | Synchronize project members with a roster.
+
+        只獲取一次成員列表，計算最少的新增、更新與移除操作後並行執行。
+        名冊未變更時只會送出一個請求。擁有者不會被更新或移除。
+        Fetches the member list once, computes the minimal add, update and
+        remove operations and applies them concurrently. An unchanged roster
+        costs one request. Owners are never updated or removed.
+
+        Args:
+            project_id (int):
+                專案 ID | Project ID
+            roster (dict):
+                成員 UID (整數或數字字串) 對應權限，或含 permission 與 note 的字典 | Member UID (an int or numeric string) to a permission, or a dict with permission and note
+            remove (bool):
+                移除名冊外的成員 | Remove members not in the roster (default: True)
+            max_workers (int):
+                並行執行緒數，設定限制器時由限制器決定 | Number of worker threads, decided by the limiter when one is set (default: 4)
+            rate_limit (float):
+                每秒請求數上限 | Maximum requests per second (default: 5.0)
+
+        Returns:
+            dict:
+                各操作的成員 UID (added、updated、removed、queued、failed)，獲取成員失敗時為 None。
+                使用延遲寫入佇列時，操作會列在 queued | Member UIDs per operation (added, updated, removed,
+                queued, failed), or None if the members could not be fetched. With a deferred write
+                queue, operations are listed under queued
+        """
+        return self.sync_all_members(
+            {project_id: roster}, remove, max_workers, rate_limit
+        )[project_id]
+
+    def sync_all_members(
+        self,
+        rosters: Dict[int, Dict[int, Union[int, dict]]],
+        remove: bool = True,
+        max_workers: int = 4,
+        rate_limit: float = 5.0,
+    ) -> Dict[int, dict]:
+        """一次同步多個專案的成員 | Synchronize the members of many projects in one pass.
+
+        所有專案共用同一個執行緒池與限速器。
+        All projects share one thread pool and rate limiter.
+
+        Args:
+            rosters (dict):
+                專案 ID 對應名冊 (格式同 `sync_members`) | Project ID to a roster (as in `sync_members`)
+            remove (bool):
+                移除名冊外的成員 | Remove members not in the roster (default: True)
+            max_workers (int):
+                並行執行緒數，設定限制器時由限制器決定 | Number of worker threads, decided by the limiter when one is set (default: 4)
+            rate_limit (float):
+                每秒請求數上限 | Maximum requests per second (default: 5.0)
+
+        Returns:
+            dict:
+                專案 ID 對應 `sync_members` 的結果 | Project ID to the result of `sync_members`
+        """
+        limiter = RateLimiter(rate_limit, burst=max_workers)
+
+        @bind_context
+        def call(fn, *args):
+            limiter.acquire()
+            return fn(*args)
+
+        workers = pool_size(self._limiter, max_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            members = {
+                project_id: executor.submit(call, self.get_members, project_id)
+                for project_id in rosters
+            }
+
+            operations, invalid = {}, {}
+            for project_id, roster in rosters.items():
+                current = members[project_id].result()
+                if isinstance(current, dict):
+                    current = current.get("results")
+                if current is None:
+                    logger.error(f"Failed to get members of project {project_id}.")
+                    continue
+                diff, invalid[project_id] = self._diff_members(current, roster, remove)
+                operations[project_id] = [
+                    (kind, uid, executor.submit(call, fn, project_id, *args))
+                    for kind, uid, fn, args in diff
+                ]
+
+        # 權限已事先驗證，延遲寫入佇列時回傳 None 代表操作已記錄
+        # Permissions are validated up front, so with a deferred write queue None means recorded
+        deferred = self._write_queue is not None and self._write_queue.deferred
+
+        results = {project_id: None for project_id in rosters}
+        for project_id, submitted in operations.items():
+            summary = {
+                "added": [],
+                "updated": [],
+                "removed": [],
+                "queued": [],
+                "failed": list(invalid[project_id]),
+            }
+            for kind, uid, future in submitted:
+                response = future.result()
+                if response is None and deferred:
+                    summary["queued"].append(uid)
+                elif response is None:
+                    summary["failed"].append(uid)
+                else:
+                    summary[kind].append(uid)
+            if summary["failed"]:
+                logger.error(
+                    f"Failed to sync members {summary['failed']} of project {project_id}."
+                )
+            results[project_id] = summary
+        return results
+
+    def _diff_members(self, members: list, roster: dict, remove: bool) -> tuple:
+        # 以 UID 建立索引，操作需要的是成員 ID | Indexed by UID, operations need the member ID
+        by_uid = {int(member["uid"]): member for member in members}
+        # 從 JSON 或 YAML 載入的名冊鍵值是字串 | Rosters loaded from JSON or YAML have string keys
+        roster = {int(uid): wanted for uid, wanted in roster.items()}
+
+        operations, invalid = [], []
+        for uid, wanted in roster.items():
+            if not isinstance(wanted, dict):
+                wanted = {"permission": wanted}
+            member = by_uid.get(uid)
+            if member is not None and member.get("permission") == 10:
+                continue
+            try:
+                wanted = {**wanted, "permission": int(wanted["permission"])}
+            except (KeyError, TypeError, ValueError):
+                wanted = {**wanted, "permission": None}
+            if wanted["permission"] not in _ASSIGNABLE:
+                logger.error(
+                    f"Permission of member {uid} should be one of {list(_ASSIGNABLE)}"
+                )
+                invalid.append(uid)
+                continue
+
+            if member is None:
+                operations.append(
+                    (
+                        "added",
+                        uid,
+                        self.add_member,
+                        (uid, wanted["permission"], wanted.get("note")),
+                    )
+                )
+                continue
+            # 未指定備註時保留原本的備註 | Keep the current note unless one is given
+            note = wanted.get("note", member.get("note"))
+            if (
+                member.get("permission") != wanted["permission"]
+                or member.get("note") != note
+            ):
+                operations.append(
+                    (
+                        "updated",
+                        uid,
+                        self.update_member,
+                        (member["id"], wanted["permission"], note),
+                    )
+                )
+
+        if remove:
+            operations.extend(
+                ("removed", uid, self.delete_member, (member["id"],))
+                for uid, member in by_uid.items()
+                if uid not in roster and member.get("permission") != 10
+            )
+        return operations, invalid
@@ -0,0 +1,140 @@
+from .base import ParaTranzAPI
+
+
+class Terms(ParaTranzAPI):
+    """
+    ParaTranz 術語 API 類別
+    ParaTranz Terms API class.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._projects_url = f"{self._api_url}/projects"
+
+    def get_terms(self, project_id: int, page: int = 1, page_size: int = 50) -> dict:
+        """獲取專案術語 | Get project terms
+
+        Args:
+            project_id (int):
+                專案 ID | Project ID
+            page (int):
+                頁碼 | Page number (default: 1)
+            page_size (int):
+                每頁數量 | Number of items per page (default: 50)
+
+        Returns:
+            dict:
+                術語資訊 | Terms information
+        """
+        terms_url = f"{self._projects_url}/{project_id}/terms"
+        params = {"page": page, "pageSize": page_size}
+        return self._request("GET", terms_url, params=params)
+
+    def create_term(
+        self,
+        project_id: int,
+        term: str,
+        translation: str,
+        pos: str = None,
+        note: str = None,
+        variants: list = None,
+        case_sensitive: bool = False,
+    ) -> dict:
+        """新增術語 | Create term
+
+        Args:
+            project_id (int):
+                專案 ID | Project ID
+            term (str):
+                術語 | Term
+            translation (str):
+                譯文 | Translation
+            pos (str):
+                詞性 | Part of speech
+                    noun: 名詞 | Noun
+                    verb: 動詞 | Verb
+                    adj: 形容詞 | Adjective
+                    adv: 副詞 | Adverb
+            note (str):
+                備註 | Note
+            variants (list):
+                變體 | Variants
+            case_sensitive (bool):
+                區分大小寫 | Case sensitive (default: False)
+
+        Returns:
+            dict:
+                術語資訊 | Term information
+        """
+        terms_url = f"{self._projects_url}/{project_id}/terms"
+        data = {
+            "term": term,
+            "translation": translation,
+            "pos": pos,
+            "note": note,
+            "variants": variants or [],
+            "caseSensitive": case_sensitive,
+        }
+        return self._request("POST", terms_url, json=data)
+
+    def update_term(
+        self,
+        project_id: int,
+        term_id: int,
+        term: str = None,
+        translation: str = None,
+        pos: str = None,
+        note: str = None,
+        variants: list = None,
+        case_sensitive: bool = None,
+    ) -> dict:
+        """更新術語 | Update term
+
+        Args:
+            project_id (int):
+                專案 ID | Project ID
+            term_id (int):
+                術語 ID | Term ID
+            term (str):
+                術語 | Term
+            translation (str):
+                譯文 | Translation
+            pos (str):
+                詞性 | Part of speech
+            note (str):
+                備註 | Note
+            variants (list):
+                變體 | Variants
+            case_sensitive (bool):
+                區分大小寫 | Case sensitive
+
+        Returns:
+            dict:
+                術語資訊 | Term information
+        """
+        terms_url = f"{self._projects_url}/{project_id}/terms/{term_id}"
+        data = {
+            "term": term,
+            "translation": translation,
+            "pos": pos,
+            "note": note,
+            "variants": variants,
+            "caseSensitive": case_sensitive,
+        }
+        return self._request("PUT", terms_url, json=data)
+
+    def delete_term(self, project_id: int, term_id: int) -> int:
+        """刪除術語 | Delete term
+
+        Args:
+            project_id (int):
+                專案 ID | Project ID
+            term_id (int):
+                術語 ID | Term ID
+
+        Returns:
+            int:
+                狀態碼 | Status code
+        """
+        terms_url = f"{self._projects_url}/{project_id}/terms/{term_id}"
+        return self._request("DELETE", terms_url, return_status=True)
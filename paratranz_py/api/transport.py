@@ -0,0 +1,168 @@
+import requests
+
+from loguru import logger
+from requests.structures import CaseInsensitiveDict
+
+
+class Transport:
+    """
+    HTTP 傳輸層的基底類別
+    Base class for the HTTP transport under `ParaTranzAPI._request`.
+
+    `request` 回傳 `requests.Response`，錯誤以 `requests` 的例外表示，
+    讓上層的錯誤處理與傳輸方式無關。
+    `request` returns a `requests.Response` and raises `requests` exceptions,
+    so error handling above it does not depend on the transport.
+    """
+
+    name = "base"
+
+    def request(
+        self, method: str, url: str, timeout: float = 10, **kwargs
+    ) -> requests.Response:
+        """送出請求 | Send a request.
+
+        Args:
+            method (str):
+                HTTP 方法 | HTTP method
+            url (str):
+                請求網址 | Request URL
+            timeout (float):
+                逾時秒數 | Timeout in seconds (default: 10)
+            kwargs:
+                `requests` 參數，例如 json、data、params、files | `requests` parameters, such as json, data, params, files
+
+        Returns:
+            requests.Response:
+                回應 | The response
+        """
+        raise NotImplementedError
+
+    def update_headers(self, headers: dict):
+        """加入每個請求都會帶上的標頭，例如驗證標頭 | Add headers sent with every request, such as authorization.
+
+        Args:
+            headers (dict):
+                要加入的標頭 (值為 None 的會被略過) | Headers to add (None values are skipped)
+        """
+        if not getattr(self, "_headers_ignored", False):
+            self._headers_ignored = True
+            logger.warning(
+                f"{type(self).__name__} does not accept headers, they are ignored."
+            )
+
+    def close(self):
+        """關閉連線 | Close the connections."""
+
+
+class RequestsTransport(Transport):
+    """
+    使用 `requests.Session` 的 HTTP/1.1 傳輸層 (預設)
+    HTTP/1.1 transport using a `requests.Session` (default).
+    """
+
+    name = "requests"
+
+    def __init__(self, headers: dict = None):
+        """初始化傳輸層 | Initialize the transport.
+
+        Args:
+            headers (dict):
+                每個請求都會帶上的標頭 | Headers sent with every request
+        """
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+
+    def request(
+        self, method: str, url: str, timeout: float = 10, **kwargs
+    ) -> requests.Response:
+        return self.session.request(method, url, timeout=timeout, **kwargs)
+
+    def update_headers(self, headers: dict):
+        self.session.headers.update(
+            {key: value for key, value in headers.items() if value is not None}
+        )
+
+    def close(self):
+        self.session.close()
+
+
+class HTTPXTransport(Transport):
+    """
+    使用 httpx 的 HTTP/2 傳輸層，可在單一連線上多工處理並行請求
+    HTTP/2 transport using httpx, multiplexing concurrent requests over one connection.
+
+    需要安裝 `paratranz-py[http2]`。同一個實例可安全地在多個執行緒間共用。
+    Requires `paratranz-py[http2]`. One instance can be shared between threads.
+    """
+
+    name = "httpx"
+
+    def __init__(self, headers: dict = None, http2: bool = True):
+        """初始化傳輸層 | Initialize the transport.
+
+        Args:
+            headers (dict):
+                每個請求都會帶上的標頭 | Headers sent with every request
+            http2 (bool):
+                啟用 HTTP/2 | Enable HTTP/2 (default: True)
+        """
+        import httpx
+
+        self._httpx = httpx
+        headers = {
+            key: value for key, value in (headers or {}).items() if value is not None
+        }
+        self.client = httpx.Client(http2=http2, headers=headers)
+
+    def request(
+        self, method: str, url: str, timeout: float = 10, **kwargs
+    ) -> requests.Response:
+        httpx = self._httpx
+
+        # 與 requests 的行為一致：略過 None 參數與表單值，並將表單值轉為字串
+        # Match requests: drop None params and form values, send form values as strings
+        if kwargs.get("params"):
+            kwargs["params"] = {
+                key: value
+                for key, value in kwargs["params"].items()
+                if value is not None
+            }
+        if kwargs.get("data"):
+            kwargs["data"] = {
+                key: str(value)
+                for key, value in kwargs["data"].items()
+                if value is not None
+            }
+
+        try:
+            response = self.client.request(method, url, timeout=timeout, **kwargs)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.RequestException(str(e)) from e
+
+        converted = requests.Response()
+        converted.status_code = response.status_code
+        converted.reason = response.reason_phrase
+        converted.headers = CaseInsensitiveDict(response.headers)
+        converted.url = str(response.url)
+        converted.encoding = response.encoding
+        converted._content = response.content
+        return converted
+
+    def update_headers(self, headers: dict):
+        self.client.headers.update(
+            {key: value for key, value in headers.items() if value is not None}
+        )
+
+    def close(self):
+        self.client.close()
+
+
+TRANSPORTS = {
+    RequestsTransport.name: RequestsTransport,
+    HTTPXTransport.name: HTTPXTransport,
+}
@@ -0,0 +1,187 @@
+import json
+import sqlite3
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from loguru import logger
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from .utils.adaptive import pool_size
+from .utils.compression import available_method, compress, decompress
+from .utils.deadline import bind_context
+from .utils.pagination import iter_pages
+from .utils.ratelimit import RateLimiter
+
+if TYPE_CHECKING:
+    from .main import ParaTranz
+
+
+class FileRevisionCrawler:
+    """
+    並行爬取專案中所有檔案的修訂記錄，並寫入 SQLite 儲存
+    Crawl the revisions of every file in a project concurrently into a SQLite store.
+
+    每個檔案的進度都會記錄在檢查點中，中斷後重新執行會從上次完成的頁面繼續。
+    Progress is checkpointed per file, so re-running after a crash resumes from
+    the last completed page.
+    """
+
+    def __init__(
+        self,
+        client: "ParaTranz",
+        project_id: int,
+        store_path: Path,
+        max_workers: int = 4,
+        rate_limit: float = 5.0,
+        page_size: int = 50,
+        compress: bool = False,
+    ):
+        """初始化爬蟲 | Initialize the crawler.
+
+        Args:
+            client (ParaTranz):
+                ParaTranz 客戶端 | The ParaTranz client
+            project_id (int):
+                專案 ID | Project ID
+            store_path (Path):
+                SQLite 儲存路徑 | SQLite store path
+            max_workers (int):
+                同時爬取的檔案數，設定限制器時由限制器決定 | Number of files crawled at the same time, decided by the limiter when one is set (default: 4)
+            rate_limit (float):
+                所有執行緒共用的每秒請求數上限 | Requests per second shared by all workers (default: 5.0)
+            page_size (int):
+                每頁數量 | Number of items per page (default: 50)
+            compress (bool):
+                以 zstd 壓縮儲存修訂記錄 (未安裝 zstandard 時改用 gzip) | Store revisions zstd-compressed, gzip without zstandard (default: False)
+        """
+        self._client = client
+        self._project_id = project_id
+        self._store_path = Path(store_path)
+        self._max_workers = max_workers
+        self._page_size = page_size
+        self._compress = available_method("zstd") if compress else None
+        self._limiter = RateLimiter(rate_limit, burst=max_workers)
+        self._lock = threading.Lock()
+
+        self._db = sqlite3.connect(self._store_path, check_same_thread=False)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS revisions (
+                id INTEGER PRIMARY KEY,
+                file_id INTEGER NOT NULL,
+                data BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS revisions_file ON revisions (file_id);
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                file_id INTEGER PRIMARY KEY,
+                page INTEGER NOT NULL,
+                done INTEGER NOT NULL DEFAULT 0
+            );
+            """
+        )
+        self._db.commit()
+
+    def crawl(self, file_ids: Iterable[int] = None) -> dict:
+        """爬取檔案修訂記錄 | Crawl file revisions.
+
+        Args:
+            file_ids (Iterable[int]):
+                要爬取的檔案 ID (為 None 將透過 `Files.get_files` 獲取全部) | File IDs to crawl (if None, all files from `Files.get_files`)
+
+        Returns:
+            dict:
+                各檔案是否完成爬取 | Whether each file was fully crawled, keyed by file ID
+        """
+        if file_ids is None:
+            files = self._client.files.get_files(self._project_id)
+            if files is None:
+                logger.error(f"Failed to list files of project {self._project_id}.")
+                return {}
+            file_ids = [file["id"] for file in files]
+
+        history = self._client.history
+        workers = pool_size(self._client.limiter, self._max_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            crawl_file = bind_context(self._crawl_file)
+            results = executor.map(lambda fid: crawl_file(history, fid), file_ids)
+            return dict(results)
+
+    def _crawl_file(self, history, file_id: int) -> tuple:
+        checkpoint = self._checkpoint(file_id)
+        if checkpoint is not None and checkpoint[1]:
+            return file_id, True
+        start_page = checkpoint[0] + 1 if checkpoint is not None else 1
+
+        def get_file_revisions(*args, **kwargs):
+            self._limiter.acquire()
+            return history.get_file_revisions(*args, **kwargs)
+
+        for data in iter_pages(
+            get_file_revisions,
+            self._project_id,
+            file_id=file_id,
+            page_size=self._page_size,
+            start_page=start_page,
+        ):
+            page = data.get("page", start_page)
+            done = page >= data.get("pageCount", 0)
+            self._write_page(file_id, page, done, data.get("results", []))
+            if done:
+                return file_id, True
+
+        logger.warning(f"Revisions of file {file_id} are incomplete, resume later.")
+        return file_id, False
+
+    def _checkpoint(self, file_id: int) -> Optional[tuple]:
+        with self._lock:
+            return self._db.execute(
+                "SELECT page, done FROM checkpoints WHERE file_id = ?", (file_id,)
+            ).fetchone()
+
+    def _write_page(self, file_id: int, page: int, done: bool, revisions: list):
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO revisions (id, file_id, data) VALUES (?, ?, ?)",
+                [
+                    (revision["id"], file_id, self._encode(revision))
+                    for revision in revisions
+                ],
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO checkpoints (file_id, page, done) VALUES (?, ?, ?)",
+                (file_id, page, int(done)),
+            )
+
+    def iter_revisions(self, file_id: int = None) -> Iterator[dict]:
+        """從儲存中讀取修訂記錄 | Read revisions back from the store.
+
+        Args:
+            file_id (int):
+                檔案 ID (為 None 將回傳全部) | File ID (if None, return all)
+
+        Yields:
+            dict:
+                修訂記錄 | A revision record
+        """
+        query = "SELECT data FROM revisions"
+        params = ()
+        if file_id is not None:
+            query += " WHERE file_id = ?"
+            params = (file_id,)
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY id", params).fetchall()
+        for (data,) in rows:
+            if isinstance(data, bytes):
+                data = decompress(data)
+            yield json.loads(data)
+
+    def _encode(self, revision: dict):
+        data = json.dumps(revision, ensure_ascii=False)
+        if self._compress:
+            return compress(data.encode(), self._compress)
+        return data
+
+    def close(self):
+        """關閉儲存 | Close the store."""
+        self._db.close()
@@ -0,0 +1,229 @@
+import json
+import os
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from loguru import logger
+from typing import TYPE_CHECKING, Iterable, Iterator, Tuple, Union
+
+from .utils.compression import SUFFIXES, available_method, compress, read_bytes
+
+if TYPE_CHECKING:
+    from .api.files import Files
+
+FORMATS = {
+    "json": ".json",
+    "json-tree": ".json",
+    "lang": ".lang",
+    "properties": ".properties",
+}
+
+
+def convert_translation(entries: list, fmt: str, fallback: bool = True) -> bytes:
+    """將翻譯詞條轉換為遊戲格式 | Convert translation entries into a game-native format.
+
+    Args:
+        entries (list):
+            `Files.get_translation_file` 的回應 | The `Files.get_translation_file` response
+        fmt (str):
+            輸出格式 | Output format
+                json: 平面 JSON | Flat JSON
+                json-tree: 以 `.` 分層的 JSON | JSON nested on `.`
+                lang: `key=value` 格式 | `key=value` lines
+                properties: Java properties
+        fallback (bool):
+            未翻譯時使用原文 | Use the original text when untranslated (default: True)
+
+    Returns:
+        bytes:
+            UTF-8 編碼的輸出內容 | UTF-8 encoded output
+    """
+    pairs = []
+    for entry in entries:
+        value = entry.get("translation")
+        if not value and fallback:
+            value = entry.get("original")
+        if value is not None:
+            pairs.append((entry["key"], value))
+
+    if fmt == "json":
+        text = json.dumps(dict(pairs), ensure_ascii=False, indent=2)
+    elif fmt == "json-tree":
+        tree = {}
+        for key, value in pairs:
+            *parents, leaf = key.split(".")
+            node = tree
+            for part in parents:
+                child = node.setdefault(part, {})
+                if not isinstance(child, dict):
+                    child = node[part] = {"": child}
+                node = child
+            if isinstance(node.get(leaf), dict):
+                node[leaf][""] = value
+            else:
+                node[leaf] = value
+        text = json.dumps(tree, ensure_ascii=False, indent=2)
+    elif fmt == "lang":
+        text = "".join(
+            "{}={}\n".format(key, value.replace("\n", "\\n")) for key, value in pairs
+        )
+    elif fmt == "properties":
+        text = "".join(
+            f"{_escape_property(key, True)}={_escape_property(value)}\n"
+            for key, value in pairs
+        )
+    else:
+        raise ValueError(f"Unsupported format: {fmt}")
+
+    return text.encode("utf-8")
+
+
+def _escape_property(text: str, is_key: bool = False) -> str:
+    text = (
+        text.replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\t", "\\t")
+    )
+    if is_key:
+        for char in "=: #!":
+            text = text.replace(char, "\\" + char)
+    elif text.startswith(" "):
+        text = "\\" + text
+    return text
+
+
+def _convert_payload(
+    payload: Union[bytes, str], fmt: str, fallback: bool, method: str
+) -> bytes:
+    # 在子行程中解析與壓縮，只在行程間傳遞位元組
+    # Parsed and compressed in the worker so only bytes cross processes
+    if isinstance(payload, str):
+        payload = read_bytes(payload)
+    output = convert_translation(json.loads(payload), fmt, fallback)
+    return compress(output, method) if method else output
+
+
+def export_translations(
+    items: Iterable[Tuple[Path, Union[bytes, Path]]],
+    fmt: str = "json",
+    max_workers: int = None,
+    max_in_flight: int = None,
+    fallback: bool = True,
+    compress: str = None,
+) -> Iterator[Path]:
+    """以行程池並行轉換並寫出翻譯檔案 | Convert and write translation files across a process pool.
+
+    輸入與輸出皆以位元組在行程間傳遞，結果依輸入順序寫出。
+    Inputs and outputs cross process boundaries as bytes, and results are
+    written in input order.
+
+    Args:
+        items (Iterable[Tuple[Path, bytes | Path]]):
+            (輸出路徑, 原始 JSON 內容或其檔案路徑) | (output path, raw JSON body or a path to it)
+        fmt (str):
+            輸出格式，參見 `convert_translation` | Output format, see `convert_translation` (default: "json")
+        max_workers (int):
+            行程數 (預設為 CPU 數) | Number of processes (default: CPU count)
+        max_in_flight (int):
+            同時處理中的檔案上限 | Maximum files being processed at once (default: 2 * max_workers)
+        fallback (bool):
+            未翻譯時使用原文 | Use the original text when untranslated (default: True)
+        compress (str):
+            以 zstd 或 gzip 壓縮輸出並加上 .zst/.gz 副檔名 (未安裝 zstandard 時改用 gzip) | Compress outputs with zstd or gzip and add the .zst/.gz suffix (gzip without zstandard) (default: None)
+
+    Yields:
+        Path:
+            已寫出的輸出路徑 | Written output path
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}")
+    if compress is not None:
+        # 副檔名依實際使用的壓縮方式決定 | The suffix follows the method actually used
+        compress = available_method(compress)
+
+    max_workers = max_workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * max_workers
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+
+        def drain(limit: int) -> Iterator[Path]:
+            while len(pending) > limit:
+                output_path, future = pending.popleft()
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                output_path.write_bytes(future.result())
+                yield output_path
+
+        for output_path, payload in items:
+            if isinstance(payload, Path):
+                payload = str(payload)
+            output_path = Path(output_path)
+            if compress is not None:
+                output_path = output_path.with_name(
+                    output_path.name + SUFFIXES[compress]
+                )
+            future = executor.submit(_convert_payload, payload, fmt, fallback, compress)
+            pending.append((output_path, future))
+            yield from drain(max_in_flight - 1)
+        yield from drain(0)
+
+
+def export_project(
+    files: "Files",
+    project_id: int,
+    output_dir: Path,
+    fmt: str = "json",
+    max_workers: int = None,
+    max_in_flight: int = None,
+    fallback: bool = True,
+    compress: str = None,
+) -> Iterator[Path]:
+    """下載並匯出專案的所有翻譯檔案 | Download and export every translation file of a project.
+
+    Args:
+        files (Files):
+            Files API 實例 | The Files API instance
+        project_id (int):
+            專案 ID | Project ID
+        output_dir (Path):
+            輸出資料夾，保留 ParaTranz 上的路徑 | Output directory, keeping the ParaTranz paths
+        fmt (str):
+            輸出格式，參見 `convert_translation` | Output format, see `convert_translation` (default: "json")
+        max_workers (int):
+            行程數 (預設為 CPU 數) | Number of processes (default: CPU count)
+        max_in_flight (int):
+            同時處理中的檔案上限 | Maximum files being processed at once (default: 2 * max_workers)
+        fallback (bool):
+            未翻譯時使用原文 | Use the original text when untranslated (default: True)
+        compress (str):
+            以 zstd 或 gzip 壓縮輸出並加上 .zst/.gz 副檔名 (未安裝 zstandard 時改用 gzip) | Compress outputs with zstd or gzip and add the .zst/.gz suffix (gzip without zstandard) (default: None)
+
+    Yields:
+        Path:
+            已寫出的輸出路徑 | Written output path
+    """
+    output_dir = Path(output_dir)
+    root = output_dir.resolve()
+    file_list = files.get_files(project_id)
+    if file_list is None:
+        logger.error(f"Failed to list files of project {project_id}.")
+        return
+
+    def download() -> Iterator[tuple]:
+        for file in file_list:
+            payload = files.get_translation_file(project_id, file["id"], raw=True)
+            if not isinstance(payload, bytes):
+                logger.error(f"Failed to download translation of {file['name']}.")
+                continue
+            output_path = (output_dir / file["name"]).with_suffix(FORMATS[fmt])
+            # 檔名來自伺服器，不允許寫出輸出資料夾之外 | Names come from the server, never write outside output_dir
+            if root not in output_path.resolve().parents:
+                logger.error(f"Skipped {file['name']}, it is outside {output_dir}.")
+                continue
+            yield output_path, payload
+
+    yield from export_translations(
+        download(), fmt, max_workers, max_in_flight, fallback, compress
+    )
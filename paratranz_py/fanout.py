@@ -0,0 +1,125 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from loguru import logger
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, NamedTuple
+
+from .utils.adaptive import pool_size
+from .utils.deadline import bind_context
+
+if TYPE_CHECKING:
+    from .main import ParaTranz
+
+
+class FanOutResult(NamedTuple):
+    """
+    單一專案操作的結果
+    Result of one operation on one project.
+    """
+
+    project_id: int
+    operation: str
+    result: Any = None
+    error: Exception = None
+
+
+def default_operations(client: "ParaTranz") -> Dict[str, Callable[[int], Any]]:
+    """建立專案概覽用的預設操作 | Build the default operations for a project overview.
+
+    Args:
+        client (ParaTranz):
+            ParaTranz 客戶端 | The ParaTranz client
+
+    Returns:
+        dict:
+            操作名稱對應接受專案 ID 的函式 | Operation name to a callable taking a project ID
+    """
+    return {
+        "project": client.projects.get_project,
+        "scores": client.scores.get_scores,
+        "members": client.members.get_members,
+        "artifacts": client.artifacts.get_artifacts_info,
+    }
+
+
+def fan_out(
+    client: "ParaTranz",
+    project_ids: Iterable[int] = None,
+    operations: Dict[str, Callable[[int], Any]] = None,
+    max_workers: int = 8,
+) -> Iterator[FanOutResult]:
+    """對多個專案並行執行操作，並依完成順序回傳結果 | Run operations on many projects concurrently, yielding results as they complete.
+
+    單一操作拋出的例外會被記錄在結果中，不會中斷其他操作。
+    An exception raised by one operation is recorded in its result and does
+    not stop the others.
+
+    Args:
+        client (ParaTranz):
+            ParaTranz 客戶端 | The ParaTranz client
+        project_ids (Iterable[int]):
+            專案 ID (為 None 將透過 `Projects.get_projects` 獲取全部) | Project IDs (if None, all from `Projects.get_projects`)
+        operations (dict):
+            操作名稱對應接受專案 ID 的函式 (預設為 `default_operations`) | Operation name to a callable taking a project ID (default: `default_operations`)
+        max_workers (int):
+            全域並行上限，設定限制器時由限制器決定 | Global concurrency cap, decided by the limiter when one is set (default: 8)
+
+    Yields:
+        FanOutResult:
+            單一專案操作的結果 | Result of one operation on one project
+    """
+    if project_ids is None:
+        projects = client.projects.get_projects()
+        if isinstance(projects, dict):
+            projects = projects.get("results", [])
+        if projects is None:
+            logger.error("Failed to list projects.")
+            return
+        project_ids = [project["id"] for project in projects]
+
+    if operations is None:
+        operations = default_operations(client)
+
+    @bind_context
+    def run(project_id: int, name: str, operation: Callable) -> FanOutResult:
+        try:
+            return FanOutResult(project_id, name, operation(project_id))
+        except Exception as e:
+            logger.error(f"{name} failed on project {project_id}: {str(e)}")
+            return FanOutResult(project_id, name, error=e)
+
+    workers = pool_size(client.limiter, max_workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run, project_id, name, operation)
+            for project_id in project_ids
+            for name, operation in operations.items()
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def snapshot(
+    client: "ParaTranz",
+    project_ids: Iterable[int] = None,
+    operations: Dict[str, Callable[[int], Any]] = None,
+    max_workers: int = 8,
+) -> Dict[int, dict]:
+    """收集所有專案的概覽 | Collect an overview of every project.
+
+    Args:
+        client (ParaTranz):
+            ParaTranz 客戶端 | The ParaTranz client
+        project_ids (Iterable[int]):
+            專案 ID (為 None 將獲取全部) | Project IDs (if None, all projects)
+        operations (dict):
+            操作名稱對應接受專案 ID 的函式 | Operation name to a callable taking a project ID
+        max_workers (int):
+            全域並行上限，設定限制器時由限制器決定 | Global concurrency cap, decided by the limiter when one is set (default: 8)
+
+    Returns:
+        dict:
+            專案 ID 對應各操作結果 | Operation results keyed by project ID
+    """
+    overview = {}
+    for item in fan_out(client, project_ids, operations, max_workers):
+        overview.setdefault(item.project_id, {})[item.operation] = item.result
+    return overview
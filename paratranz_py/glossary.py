@@ -0,0 +1,210 @@
+import json
+import time
+
+from collections import deque
+from pathlib import Path
+from loguru import logger
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Tuple
+
+from .utils.compression import read_bytes, write_bytes
+from .utils.pagination import iter_pages
+
+if TYPE_CHECKING:
+    from .api.terms import Terms
+
+
+class Glossary:
+    """
+    以 Aho-Corasick 自動機比對術語的本地詞彙表
+    Local glossary matching terms with an Aho-Corasick automaton.
+
+    所有術語 (含變體) 編譯成單一自動機，掃描一段文字的時間與文字長度成線性關係，
+    與術語數量無關。
+    All terms and their variants are compiled into one automaton, so scanning
+    a text is linear in its length regardless of the number of terms.
+    """
+
+    def __init__(self, terms: List[dict]):
+        """初始化詞彙表 | Initialize the glossary.
+
+        Args:
+            terms (List[dict]):
+                `Terms.get_terms` 回應中的術語 | Terms from `Terms.get_terms` responses
+        """
+        self.terms = terms
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for index, term in enumerate(terms):
+            for pattern in [term.get("term"), *(term.get("variants") or [])]:
+                if pattern:
+                    self._add(_fold(pattern), index, pattern)
+        self._build()
+
+    @classmethod
+    def fetch(
+        cls,
+        terms: "Terms",
+        project_id: int,
+        cache_path: Path = None,
+        max_age: float = 3600,
+        page_size: int = 800,
+    ) -> "Glossary":
+        """獲取專案術語並建立詞彙表，可使用本地快取 | Fetch project terms into a glossary, with an optional local cache.
+
+        只有完整抓取到最後一頁時才會寫入快取；抓取失敗時會改用過期的快取。
+        The cache is only written once the last page has been fetched; a
+        failed fetch falls back to the stale cache.
+
+        Args:
+            terms (Terms):
+                Terms API 實例 | The Terms API instance
+            project_id (int):
+                專案 ID | Project ID
+            cache_path (Path):
+                快取檔案路徑 (.zst 或 .gz 副檔名會壓縮儲存) | Cache file path (a .zst or .gz suffix stores it compressed)
+            max_age (float):
+                快取有效秒數 | Seconds before the cache is refreshed (default: 3600)
+            page_size (int):
+                每頁數量 | Number of items per page (default: 800)
+
+        Returns:
+            Glossary:
+                詞彙表 | The glossary
+        """
+        if cache_path is not None:
+            cache_path = Path(cache_path)
+            if (
+                cache_path.exists()
+                and time.time() - cache_path.stat().st_mtime < max_age
+            ):
+                return cls(json.loads(read_bytes(cache_path)))
+
+        results = []
+        complete = False
+        for data in iter_pages(terms.get_terms, project_id, page_size=page_size):
+            results.extend(data.get("results", []))
+            complete = data.get("page", 1) >= data.get("pageCount", 0)
+
+        # 只快取完整的術語列表，抓取中斷時改用過期的快取
+        # Only complete term lists are cached; an interrupted fetch falls back to the stale cache
+        if not complete:
+            if cache_path is not None and cache_path.exists():
+                logger.warning(
+                    f"Failed to fetch all terms of project {project_id}, using the stale cache."
+                )
+                return cls(json.loads(read_bytes(cache_path)))
+            logger.error(
+                f"Fetched only {len(results)} terms of project {project_id}, not cached."
+            )
+            return cls(results)
+
+        logger.info(f"Fetched {len(results)} terms of project {project_id}.")
+        if cache_path is not None:
+            write_bytes(cache_path, json.dumps(results, ensure_ascii=False).encode())
+        return cls(results)
+
+    def _add(self, pattern: str, index: int, original: str):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((len(pattern), index, original))
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> Iterator[Tuple[int, int, dict]]:
+        """找出文字中出現的術語 | Find the terms occurring in a text.
+
+        Args:
+            text (str):
+                要掃描的文字 | Text to scan
+
+        Yields:
+            Tuple[int, int, dict]:
+                (起始位置, 結束位置, 術語) | (start, end, term)
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for position, char in enumerate(_fold(text)):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, index, original in output[state]:
+                start, end = position + 1 - length, position + 1
+                term = self.terms[index]
+                if term.get("caseSensitive") and text[start:end] != original:
+                    continue
+                if _is_bounded(text, start, end):
+                    yield start, end, term
+
+    def scan(
+        self, strings: Iterable[dict], only_inconsistent: bool = False
+    ) -> Iterator[dict]:
+        """檢查詞條的原文術語是否使用了對應譯文 | Check that terms in the originals use their translations.
+
+        Args:
+            strings (Iterable[dict]):
+                `Strings.get_strings` 回應中的詞條 | Strings from `Strings.get_strings` responses
+            only_inconsistent (bool):
+                只回傳已翻譯但未使用術語譯名的結果 | Only yield translated strings missing the term translation (default: False)
+
+        Yields:
+            dict:
+                詞條 ID、術語、位置與是否一致 | String ID, term, position and whether it is consistent
+        """
+        for string in strings:
+            translation = string.get("translation") or ""
+            if only_inconsistent and not translation:
+                continue
+            for start, end, term in self.find(string.get("original") or ""):
+                expected = term.get("translation") or ""
+                consistent = bool(translation) and expected in translation
+                if only_inconsistent and consistent:
+                    continue
+                yield {
+                    "string_id": string.get("id"),
+                    "term": term,
+                    "start": start,
+                    "end": end,
+                    "consistent": consistent,
+                }
+
+
+def _fold(text: str) -> str:
+    # 逐字轉小寫並保持長度不變 (例如 "İ".lower() 為兩個字元)，位置才能對應原文
+    # Lowercase char by char keeping the length ("İ".lower() is two chars), so offsets map back to the text
+    return "".join(
+        lower if len(lower) == 1 else char
+        for char, lower in ((char, char.lower()) for char in text)
+    )
+
+
+def _is_bounded(text: str, start: int, end: int) -> bool:
+    # 英數字術語需要完整單字匹配 | Alphanumeric terms must match whole words
+    if _is_word(text[start]) and start > 0 and _is_word(text[start - 1]):
+        return False
+    if _is_word(text[end - 1]) and end < len(text) and _is_word(text[end]):
+        return False
+    return True
+
+
+def _is_word(char: str) -> bool:
+    return char.isascii() and (char.isalnum() or char == "_")
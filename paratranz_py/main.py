@@ -1,11 +1,10 @@
-from .api.projects import Projects
-from .api.strings import Strings
-from .api.files import Files
-from .api.history import History
-from .api.members import Members
-from .api.artifacts import Artifacts
-from .api.users import Users
-from .api.scores import Scores
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from .utils.adaptive import AdaptiveConcurrencyLimiter
+    from .utils.hedging import Hedger
+    from .api.transport import Transport
+    from .wal import WriteAheadQueue
 
 
 class ParaTranz:
@@ -13,16 +12,24 @@ class ParaTranz:
     ParaTranz class is the main class of the ParaTranz API wrapper.
 
     Current missing API:
-        - Terms
         - Issues
         - Mails
     """
 
-    __slots__ = ("_api_token", "_api_url", "_headers")
+    __slots__ = ("_api_token", "_api_url", "_headers", "_api_options")
 
     DEFAULT_API_URL = "https://paratranz.cn/api"
 
-    def __init__(self, api_token: str = None, api_url: str = None):
+    def __init__(
+        self,
+        api_token: str = None,
+        api_url: str = None,
+        write_queue: "WriteAheadQueue" = None,
+        single_flight: bool = False,
+        transport: Union[str, "Transport"] = None,
+        limiter: "AdaptiveConcurrencyLimiter" = None,
+        hedger: "Hedger" = None,
+    ):
         """初始化 ParaTranz 類別 | Initialize the ParaTranz class.
 
         Args:
@@ -30,6 +37,18 @@ class ParaTranz:
                 The API token.
             api_url (str):
                 The API URL (default: https://paratranz.cn/api).
+            write_queue (WriteAheadQueue):
+                The write-ahead queue for mutations (default: None).
+            single_flight (bool):
+                Share one in-flight request among identical concurrent GETs (default: False).
+            transport (str | Transport):
+                The HTTP transport shared by all sub-APIs, "requests" or "httpx" for
+                HTTP/2 (default: None, each sub-API uses its own requests session).
+                The authorization headers are added to a given instance.
+            limiter (AdaptiveConcurrencyLimiter):
+                The adaptive concurrency limiter shared by all requests (default: None).
+            hedger (Hedger):
+                The hedger for slow GET requests (default: None).
         """
         self._api_token = api_token
         self._api_url = api_url or self.DEFAULT_API_URL
@@ -37,39 +56,97 @@ class ParaTranz:
             "Authorization": api_token,
             "User-Agent": "paratranz-py | Made by @xMikux",
         }
+        if single_flight:
+            from .utils.singleflight import SingleFlight
+
+            single_flight = SingleFlight()
+
+        if isinstance(transport, str):
+            from .api.transport import TRANSPORTS
+
+            transport = TRANSPORTS[transport](headers=self._headers)
+
+        self._api_options = {
+            "write_queue": write_queue,
+            "single_flight": single_flight or None,
+            "transport": transport,
+            "limiter": limiter,
+            "hedger": hedger,
+        }
+
+    @property
+    def limiter(self) -> "AdaptiveConcurrencyLimiter":
+        """共用的並行限制器 | The shared concurrency limiter (None if not set)."""
+        return self._api_options["limiter"]
 
     @property
     def projects(self):
-        return Projects(api_headers=self._headers, api_url=self._api_url)
+        from .api.projects import Projects
+
+        return Projects(
+            api_headers=self._headers, api_url=self._api_url, **self._api_options
+        )
 
     @property
     def strings(self):
-        return Strings(api_headers=self._headers, api_url=self._api_url)
+        from .api.strings import Strings
+
+        return Strings(
+            api_headers=self._headers, api_url=self._api_url, **self._api_options
+        )
 
     @property
     def files(self):
-        return Files(api_headers=self._headers, api_url=self._api_url)
+        from .api.files import Files
+
+        return Files(
+            api_headers=self._headers, api_url=self._api_url, **self._api_options
+        )
 
     @property
     def history(self):
-        return History(api_headers=self._headers, api_url=self._api_url)
+        from .api.history import History
+
+        return History(
+            api_headers=self._headers, api_url=self._api_url, **self._api_options
+        )
+
+    @property
+    def terms(self):
+        from .api.terms import Terms
 
-    # @property
-    # def terms(self):
-    #     return Terms(api_headers=self._headers, api_url=self._api_url)
+        return Terms(
+            api_headers=self._headers, api_url=self._api_url, **self._api_options
+        )
 
     @property
     def members(self):
-        return Members(api_headers=self._headers, api_url=self._api_url)
+        from .api.members import Members
+
+        return Members(
+            api_headers=self._headers, api_url=self._api_url, **self._api_options
+        )
 
     @property
     def artifacts(self):
-        return Artifacts(api_headers=self._headers, api_url=self._api_url)
+        from .api.artifacts import Artifacts
+
+        return Artifacts(
+            api_headers=self._headers, api_url=self._api_url, **self._api_options
+        )
 
     @property
     def users(self):
-        return Users(api_headers=self._headers, api_url=self._api_url)
+        from .api.users import Users
+
+        return Users(
+            api_headers=self._headers, api_url=self._api_url, **self._api_options
+        )
 
     @property
     def scores(self):
-        return Scores(api_headers=self._headers, api_url=self._api_url)
+        from .api.scores import Scores
+
+        return Scores(
+            api_headers=self._headers, api_url=self._api_url, **self._api_options
+        )
@@ -0,0 +1,278 @@
+import re
+import sqlite3
+import threading
+
+from array import array
+from collections import Counter
+from pathlib import Path
+from loguru import logger
+from typing import TYPE_CHECKING, Iterable, List
+
+from .utils.pagination import iter_pages
+
+if TYPE_CHECKING:
+    from .api.strings import Strings
+
+_SPACES = re.compile(r"\s+")
+
+
+class TranslationMemory:
+    """
+    以字元 n-gram 索引建立的本地翻譯記憶庫
+    Local translation memory backed by a character n-gram index.
+
+    詞條與倒排索引都儲存在 SQLite 中，開啟時直接載入索引，不需重新計算。
+    Entries and the inverted index are stored in SQLite, and the index is
+    loaded as-is when the memory is opened.
+    """
+
+    def __init__(self, path: Path, n: int = 3):
+        """開啟翻譯記憶庫 | Open the translation memory.
+
+        Args:
+            path (Path):
+                SQLite 檔案路徑 | SQLite file path
+            n (int):
+                n-gram 長度 | n-gram length (default: 3)
+        """
+        self._n = n
+        self._lock = threading.Lock()
+        self._dirty = set()
+        # 待移除的項目，在 `_flush` 時每個 n-gram 只過濾一次
+        # Pending removals, filtered once per n-gram in `_flush`
+        self._removed = {}
+
+        self._db = sqlite3.connect(Path(path), check_same_thread=False)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                project_id INTEGER NOT NULL,
+                string_id INTEGER NOT NULL,
+                original TEXT NOT NULL,
+                translation TEXT NOT NULL,
+                UNIQUE (project_id, string_id)
+            );
+            CREATE TABLE IF NOT EXISTS grams (
+                gram TEXT PRIMARY KEY,
+                postings BLOB NOT NULL
+            );
+            """
+        )
+        self._index = {}
+        for gram, postings in self._db.execute("SELECT gram, postings FROM grams"):
+            entries = array("q")
+            entries.frombytes(postings)
+            self._index[gram] = entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def add_strings(self, project_id: int, strings: Iterable[dict]) -> int:
+        """加入已翻譯的詞條 (stage ≥ 1) | Add translated strings (stage ≥ 1).
+
+        不再符合條件 (未翻譯或 stage < 1) 的既有詞條會被移除。
+        Existing entries whose string no longer qualifies (untranslated or
+        stage < 1) are removed.
+
+        Args:
+            project_id (int):
+                專案 ID | Project ID
+            strings (Iterable[dict]):
+                `Strings.get_strings` 回應中的詞條 | Strings from `Strings.get_strings` responses
+
+        Returns:
+            int:
+                新加入、更新或移除的詞條數 | Number of added, updated or removed entries
+        """
+        with self._lock, self._db:
+            added = self._add_strings(project_id, strings)
+            self._flush()
+        return added
+
+    def _add_strings(self, project_id: int, strings: Iterable[dict]) -> int:
+        added = 0
+        for string in strings:
+            original = string.get("original")
+            translation = string.get("translation")
+            row = self._db.execute(
+                "SELECT id, original, translation FROM entries"
+                " WHERE project_id = ? AND string_id = ?",
+                (project_id, string["id"]),
+            ).fetchone()
+
+            if (string.get("stage") or 0) < 1 or not original or not translation:
+                if row is not None:
+                    self._db.execute("DELETE FROM entries WHERE id = ?", (row[0],))
+                    self._unindex_entry(row[0], row[1])
+                    added += 1
+                continue
+
+            if row is None:
+                entry_id = self._db.execute(
+                    "INSERT INTO entries (project_id, string_id, original, translation)"
+                    " VALUES (?, ?, ?, ?)",
+                    (project_id, string["id"], original, translation),
+                ).lastrowid
+                self._index_entry(entry_id, original)
+            elif row[1:] != (original, translation):
+                entry_id = row[0]
+                self._db.execute(
+                    "UPDATE entries SET original = ?, translation = ? WHERE id = ?",
+                    (original, translation, entry_id),
+                )
+                if row[1] != original:
+                    self._unindex_entry(entry_id, row[1])
+                    self._index_entry(entry_id, original)
+            else:
+                continue
+            added += 1
+        return added
+
+    def update(self, strings: "Strings", project_id: int, page_size: int = 800) -> int:
+        """從專案抓取詞條並加入記憶庫 | Fetch a project's strings into the memory.
+
+        Args:
+            strings (Strings):
+                Strings API 實例 | The Strings API instance
+            project_id (int):
+                專案 ID | Project ID
+            page_size (int):
+                每頁數量 | Number of items per page (default: 800)
+
+        Returns:
+            int:
+                新加入、更新或移除的詞條數 | Number of added, updated or removed entries
+        """
+        added = 0
+        for data in iter_pages(
+            strings.get_strings, project_id, stage=None, page_size=page_size
+        ):
+            with self._lock:
+                added += self._add_strings(project_id, data.get("results", []))
+        # 詞條與索引在最後一起提交，避免每頁重寫常見的 n-gram
+        # Entries and index are committed together once, so common n-grams
+        # are not rewritten for every page
+        with self._lock, self._db:
+            self._flush()
+        logger.info(f"Added {added} strings of project {project_id} to memory.")
+        return added
+
+    def suggest(
+        self, text: str, k: int = 5, min_score: float = 0.3, max_postings: int = 200_000
+    ) -> List[dict]:
+        """查詢相似的已翻譯詞條 | Look up similar translated strings.
+
+        Args:
+            text (str):
+                要翻譯的原文 | Original text to translate
+            k (int):
+                回傳數量 | Number of suggestions (default: 5)
+            min_score (float):
+                最低相似度 (Dice 係數) | Minimum similarity, as a Dice coefficient (default: 0.3)
+            max_postings (int):
+                候選階段最多掃描的索引項目數，會優先使用較少見的 n-gram |
+                Maximum postings scanned for candidates, rarest n-grams first (default: 200000)
+
+        Returns:
+            List[dict]:
+                依相似度排序的建議 | Suggestions sorted by similarity
+        """
+        grams = self._grams(text)
+        if not grams:
+            return []
+
+        with self._lock:
+            postings = sorted(
+                (self._index[gram] for gram in grams if gram in self._index), key=len
+            )
+            candidates = Counter()
+            scanned = 0
+            for entries in postings:
+                if scanned and scanned + len(entries) > max_postings:
+                    break
+                candidates.update(entries)
+                scanned += len(entries)
+
+            top = [entry_id for entry_id, _ in candidates.most_common(k * 10)]
+            if not top:
+                return []
+            rows = self._db.execute(
+                "SELECT id, project_id, string_id, original, translation FROM entries"
+                f" WHERE id IN ({','.join('?' * len(top))})",
+                top,
+            ).fetchall()
+
+        suggestions = []
+        for _, project_id, string_id, original, translation in rows:
+            other = self._grams(original)
+            score = 2 * len(grams & other) / (len(grams) + len(other))
+            if score >= min_score:
+                suggestions.append(
+                    {
+                        "project_id": project_id,
+                        "string_id": string_id,
+                        "original": original,
+                        "translation": translation,
+                        "score": round(score, 4),
+                    }
+                )
+        suggestions.sort(key=lambda suggestion: suggestion["score"], reverse=True)
+        return suggestions[:k]
+
+    def close(self):
+        """關閉記憶庫 | Close the memory."""
+        self._db.close()
+
+    def _grams(self, text: str) -> set:
+        text = f" {_SPACES.sub(' ', text.lower()).strip()} "
+        if len(text) <= self._n:
+            return {text}
+        return {text[i : i + self._n] for i in range(len(text) - self._n + 1)}
+
+    def _index_entry(self, entry_id: int, original: str):
+        for gram in self._grams(original):
+            removed = self._removed.get(gram)
+            if removed is not None and entry_id in removed:
+                # 新舊原文都有的 n-gram 保留原本的項目 | Kept for grams in both the old and new original
+                removed.discard(entry_id)
+                continue
+            self._index.setdefault(gram, array("q")).append(entry_id)
+            self._dirty.add(gram)
+
+    def _unindex_entry(self, entry_id: int, original: str):
+        for gram in self._grams(original):
+            if gram in self._index:
+                self._removed.setdefault(gram, set()).add(entry_id)
+
+    def _flush(self):
+        # 每個 n-gram 只重建一次，大量移除時仍與索引大小成線性
+        # Each gram is rebuilt once, so bulk removals stay linear in the index size
+        for gram, removed in self._removed.items():
+            if not removed:
+                continue
+            # 同時清除舊版本留下的重複項目 | Also drops duplicates left by older versions
+            entries = array(
+                "q", (entry for entry in self._index[gram] if entry not in removed)
+            )
+            if entries:
+                self._index[gram] = entries
+            else:
+                del self._index[gram]
+            self._dirty.add(gram)
+        self._removed.clear()
+
+        self._db.executemany(
+            "INSERT OR REPLACE INTO grams (gram, postings) VALUES (?, ?)",
+            [
+                (gram, self._index[gram].tobytes())
+                for gram in self._dirty
+                if gram in self._index
+            ],
+        )
+        self._db.executemany(
+            "DELETE FROM grams WHERE gram = ?",
+            [(gram,) for gram in self._dirty if gram not in self._index],
+        )
+        self._dirty.clear()
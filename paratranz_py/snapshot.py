@@ -0,0 +1,206 @@
+from pathlib import Path
+from loguru import logger
+from typing import TYPE_CHECKING, Iterable
+
+from .utils.pagination import iter_pages
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from .api.strings import Strings
+
+# 詞條翻譯狀態的固定字典 | Fixed dictionary of string stages
+STAGES = [-9, 0, 1, 2, 3, 5, 9]
+_STAGE_INDEX = {stage: index for index, stage in enumerate(STAGES)}
+
+
+class StringsSnapshotWriter:
+    """
+    將詞條以欄式格式 (Arrow IPC 或 Parquet) 逐批寫入
+    Write strings to a columnar snapshot (Arrow IPC or Parquet) batch by batch.
+
+    stage 與 file 欄位使用字典編碼，每批寫入一個 record batch 或 row group。
+    The stage and file columns are dictionary encoded, and every batch is
+    written as one record batch or row group.
+    """
+
+    def __init__(self, path: Path, format: str = "arrow", compression: str = None):
+        """建立快照檔案 | Create the snapshot file.
+
+        Args:
+            path (Path):
+                快照路徑 | Snapshot path
+            format (str):
+                檔案格式 | File format (default: "arrow")
+                    arrow: Arrow IPC 檔案 (可零複製讀取) | Arrow IPC file (zero-copy reads)
+                    parquet: Parquet
+            compression (str):
+                欄位壓縮方式，例如 "zstd" (壓縮後的 Arrow 快照無法零複製讀取) |
+                Column compression such as "zstd" (compressed Arrow snapshots are no longer zero-copy) (default: None)
+        """
+        import pyarrow as pa
+
+        if format not in ("arrow", "parquet"):
+            raise ValueError(f"Unsupported snapshot format: {format}")
+
+        self._pa = pa
+        self._format = format
+        self._files = {}
+        self.rows = 0
+        self.schema = pa.schema(
+            [
+                ("id", pa.int64()),
+                ("key", pa.string()),
+                ("original", pa.string()),
+                ("translation", pa.string()),
+                ("context", pa.string()),
+                ("stage", pa.dictionary(pa.int8(), pa.int8())),
+                ("file_id", pa.int64()),
+                ("file", pa.dictionary(pa.int32(), pa.string())),
+                ("updated_at", pa.string()),
+            ]
+        )
+
+        if format == "arrow":
+            options = pa.ipc.IpcWriteOptions(
+                compression=compression, emit_dictionary_deltas=True
+            )
+            self._writer = pa.ipc.new_file(str(path), self.schema, options=options)
+        else:
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(
+                str(path), self.schema, compression=compression or "snappy"
+            )
+
+    def write(self, strings: Iterable[dict]):
+        """寫入一批詞條 | Write a batch of strings.
+
+        Args:
+            strings (Iterable[dict]):
+                `Strings.get_strings` 回應中的詞條 | Strings from `Strings.get_strings` responses
+        """
+        pa = self._pa
+        columns = {name: [] for name in self.schema.names}
+        for string in strings:
+            file = string.get("file") or {}
+            file_name = file.get("name", "")
+            columns["id"].append(string.get("id"))
+            columns["key"].append(string.get("key"))
+            columns["original"].append(string.get("original"))
+            columns["translation"].append(string.get("translation"))
+            columns["context"].append(string.get("context"))
+            columns["stage"].append(_STAGE_INDEX.get(string.get("stage")))
+            columns["file_id"].append(string.get("fileId", file.get("id")))
+            columns["file"].append(self._files.setdefault(file_name, len(self._files)))
+            columns["updated_at"].append(string.get("updatedAt"))
+        if not columns["id"]:
+            return
+
+        # 字典只會在尾端增加，因此 Arrow IPC 可寫成 delta
+        # Dictionaries only grow at the end, so Arrow IPC can write deltas
+        arrays = []
+        for field in self.schema:
+            values = columns[field.name]
+            if field.name == "stage":
+                dictionary = pa.array(STAGES, pa.int8())
+            elif field.name == "file":
+                dictionary = pa.array(list(self._files), pa.string())
+            else:
+                arrays.append(pa.array(values, field.type))
+                continue
+            arrays.append(
+                pa.DictionaryArray.from_arrays(
+                    pa.array(values, field.type.index_type), dictionary
+                )
+            )
+
+        batch = pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+        if self._format == "arrow":
+            self._writer.write_batch(batch)
+        else:
+            self._writer.write_batch(batch, row_group_size=batch.num_rows)
+        self.rows += batch.num_rows
+
+    def close(self):
+        """完成並關閉快照 | Finish and close the snapshot."""
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def export_strings(
+    strings: "Strings",
+    project_id: int,
+    path: Path,
+    format: str = "arrow",
+    file_id: int = None,
+    page_size: int = 800,
+    compression: str = None,
+) -> int:
+    """將專案的所有詞條逐頁匯出為欄式快照 | Stream all strings of a project into a columnar snapshot.
+
+    Args:
+        strings (Strings):
+            Strings API 實例 | The Strings API instance
+        project_id (int):
+            專案 ID | Project ID
+        path (Path):
+            快照路徑 | Snapshot path
+        format (str):
+            檔案格式 (arrow 或 parquet) | File format, arrow or parquet (default: "arrow")
+        file_id (int):
+            檔案 ID (為 None 將匯出所有詞條) | File ID (if None, export all strings)
+        page_size (int):
+            每頁數量 | Number of items per page (default: 800)
+        compression (str):
+            欄位壓縮方式，例如 "zstd" | Column compression such as "zstd" (default: None)
+
+    Returns:
+        int:
+            匯出的詞條數 | Number of exported strings
+    """
+    with StringsSnapshotWriter(path, format, compression) as writer:
+        for data in iter_pages(
+            strings.get_strings,
+            project_id,
+            file_id=file_id,
+            stage=None,
+            page_size=page_size,
+        ):
+            writer.write(data.get("results", []))
+
+    logger.info(f"Exported {writer.rows} strings of project {project_id} to {path}.")
+    return writer.rows
+
+
+def open_snapshot(path: Path) -> "pa.Table":
+    """以記憶體映射開啟快照 | Open a snapshot through a memory map.
+
+    Arrow IPC 快照的欄位直接指向映射的檔案，不會複製資料。
+    Columns of an Arrow IPC snapshot point straight into the mapped file
+    without copying.
+
+    Args:
+        path (Path):
+            快照路徑 | Snapshot path
+
+    Returns:
+        pyarrow.Table:
+            詞條表格 | The strings table
+    """
+    import pyarrow as pa
+
+    with open(path, "rb") as file:
+        magic = file.read(6)
+
+    if magic == b"ARROW1":
+        return pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+
+    import pyarrow.parquet as pq
+
+    return pq.read_table(str(path), memory_map=True)
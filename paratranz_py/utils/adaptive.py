@@ -0,0 +1,194 @@
+import threading
+import time
+
+from collections import deque
+from loguru import logger
+from typing import Optional
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    依延遲與限流回應調整並行數的 AIMD 限制器
+    AIMD concurrency limiter driven by observed latency and throttling.
+
+    延遲平穩且至少用到一半上限時，並行上限每輪加一 (加法增加)；
+    遇到 429/5xx、逾時或延遲上升時乘以 `backoff` (乘法減少)。
+    同一個實例可由所有並行工具共用，工具的執行緒池會依 `max_limit` 設定大小，
+    實際並行數由限制器決定。
+    While latency stays flat and at least half the limit is in use, the
+    limit grows by one per round trip (additive increase). On 429/5xx,
+    timeouts or rising latency it is multiplied by `backoff`
+    (multiplicative decrease). One instance can be shared by every
+    concurrent helper; their pools are sized from `max_limit` so the
+    limiter, not the pool, decides the real concurrency.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        history: int = 100,
+    ):
+        """初始化限制器 | Initialize the limiter.
+
+        Args:
+            initial (int):
+                初始並行上限 | Initial concurrency limit (default: 4)
+            min_limit (int):
+                並行上限的最小值 | Lowest concurrency limit (default: 1)
+            max_limit (int):
+                並行上限的最大值 | Highest concurrency limit (default: 64)
+            backoff (float):
+                減少時的乘數 | Multiplier applied on decrease (default: 0.5)
+            latency_tolerance (float):
+                延遲超過基準的倍數時視為過載 | Latency over this multiple of the baseline counts as overload (default: 2.0)
+            smoothing (float):
+                延遲指數移動平均的權重 | Weight of the latency moving average (default: 0.2)
+            history (int):
+                保留的調整記錄數 | Number of decisions kept (default: 100)
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.decisions = deque(maxlen=history)
+
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._latency = None
+        self._baseline = None
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """目前的並行上限 | Current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """進行中的請求數 | Requests in flight."""
+        return self._in_flight
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """等待直到有可用的並行額度 | Block until a concurrency slot is free.
+
+        Args:
+            timeout (float):
+                最長等待秒數 | Longest wait in seconds (default: None, no limit)
+
+        Returns:
+            bool:
+                是否取得額度 | Whether a slot was acquired
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._in_flight < int(self._limit), timeout
+            ):
+                return False
+            self._in_flight += 1
+            return True
+
+    def cancel(self):
+        """歸還未使用的額度，不影響並行上限 | Return an unused slot without affecting the limit."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def release(self, latency: float, status: Optional[int]):
+        """歸還額度並回報結果 | Release the slot and report the outcome.
+
+        Args:
+            latency (float):
+                請求耗時秒數 | Request latency in seconds
+            status (int):
+                HTTP 狀態碼 (逾時或連線失敗為 None) | HTTP status code (None on timeout or connection failure)
+        """
+        with self._condition:
+            # 請求完成時的並行數，用來判斷上限是否真的被用到
+            # Concurrency when the request finished, to tell whether the limit is used
+            in_flight = self._in_flight
+            self._in_flight -= 1
+            throttled = status is None or status == 429 or status >= 500
+
+            if not throttled:
+                if self._latency is None:
+                    self._latency = latency
+                else:
+                    self._latency += self.smoothing * (latency - self._latency)
+                if self._baseline is None or self._latency < self._baseline:
+                    self._baseline = self._latency
+                else:
+                    # 基準緩慢上升，以適應伺服器長期變慢 | Drifts up slowly to follow a lasting slowdown
+                    self._baseline += self.smoothing * 0.05 * (latency - self._baseline)
+
+            overloaded = throttled or (
+                self._latency > self._baseline * self.latency_tolerance
+            )
+            if overloaded:
+                # 每個延遲週期最多減少一次，避免同一波錯誤重複減半
+                # Decrease at most once per round trip so one burst does not compound
+                now = time.monotonic()
+                if now - self._last_decrease >= (self._latency or latency):
+                    self._last_decrease = now
+                    reason = f"status {status}" if throttled else "latency"
+                    self._set_limit(self._limit * self.backoff, reason)
+            elif in_flight >= self._limit / 2:
+                # 負載低於上限一半時不增加，避免閒置時上限漂移到最大值
+                # Not raised while under half the limit, so an idle client does not drift to max_limit
+                self._set_limit(self._limit + 1 / self._limit, "increase")
+
+            self._condition.notify_all()
+
+    def _set_limit(self, limit: float, reason: str):
+        previous = int(self._limit)
+        self._limit = min(max(limit, self.min_limit), self.max_limit)
+        if int(self._limit) != previous:
+            self.decisions.append(
+                {"time": time.time(), "limit": int(self._limit), "reason": reason}
+            )
+            logger.debug(
+                f"Concurrency limit {previous} -> {int(self._limit)} ({reason})"
+            )
+
+    def metrics(self) -> dict:
+        """目前的狀態與調整記錄 | Current state and decisions.
+
+        Returns:
+            dict:
+                並行上限、進行中請求、延遲與調整記錄 | Limit, requests in flight, latency and decisions
+        """
+        with self._condition:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "latency": self._latency,
+                "baseline_latency": self._baseline,
+                "decisions": list(self.decisions),
+            }
+
+
+def pool_size(limiter: Optional[AdaptiveConcurrencyLimiter], max_workers: int) -> int:
+    """並行工具的執行緒數 | Number of threads for a concurrent helper.
+
+    設定限制器時執行緒池不應成為上限，否則並行上限無法成長。
+    With a limiter the pool must not be the cap, or the limit could never grow.
+
+    Args:
+        limiter (AdaptiveConcurrencyLimiter):
+            共用的限制器 (可為 None) | The shared limiter (may be None)
+        max_workers (int):
+            未設定限制器時的執行緒數 | Number of threads without a limiter
+
+    Returns:
+        int:
+            執行緒數 | Number of threads
+    """
+    if limiter is None:
+        return max_workers
+    return max(max_workers, limiter.max_limit)
@@ -0,0 +1,123 @@
+import gzip
+
+from pathlib import Path
+from loguru import logger
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+GZIP_MAGIC = b"\x1f\x8b"
+
+SUFFIXES = {"zstd": ".zst", "gzip": ".gz"}
+
+
+def available_method(method: str = "zstd") -> str:
+    """取得可用的壓縮方式，zstd 無法使用時改用 gzip | Get a usable compression method, falling back to gzip when zstd is unavailable.
+
+    輸出檔名應依此回傳值決定副檔名。
+    Output file names should take their suffix from the returned method.
+
+    Args:
+        method (str):
+            想要的壓縮方式 | Preferred compression method (default: "zstd")
+
+    Returns:
+        str:
+            實際可用的壓縮方式 | The compression method that can be used
+    """
+    if method == "zstd":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            logger.warning("zstandard is not installed, using gzip instead.")
+            return "gzip"
+    elif method != "gzip":
+        raise ValueError(f"Unsupported compression method: {method}")
+    return method
+
+
+def compress(data: bytes, method: str = "zstd", level: int = 3) -> bytes:
+    """壓縮資料 | Compress data.
+
+    Args:
+        data (bytes):
+            原始資料 | Raw data
+        method (str):
+            壓縮方式 | Compression method (default: "zstd")
+                zstd: 需要 `zstandard`，未安裝時拋出 ImportError (可先以 `available_method` 選擇) |
+                    Requires `zstandard` and raises ImportError without it (pick one with `available_method` first)
+                gzip: 標準庫 gzip | Standard library gzip
+        level (int):
+            壓縮等級 | Compression level (default: 3)
+
+    Returns:
+        bytes:
+            壓縮後的資料 | Compressed data
+    """
+    if method == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "zstd compression requires zstandard, install paratranz-py[zstd]."
+            ) from e
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    elif method != "gzip":
+        raise ValueError(f"Unsupported compression method: {method}")
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def decompress(data: bytes) -> bytes:
+    """依檔頭自動解壓縮，未壓縮的資料原樣回傳 | Decompress by magic bytes, returning uncompressed data as-is.
+
+    Args:
+        data (bytes):
+            可能已壓縮的資料 | Possibly compressed data
+
+    Returns:
+        bytes:
+            解壓縮後的資料 | Decompressed data
+    """
+    if data.startswith(ZSTD_MAGIC):
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    if data.startswith(GZIP_MAGIC):
+        return gzip.decompress(data)
+    return data
+
+
+def write_bytes(path: Path, data: bytes, method: str = None) -> Path:
+    """寫入檔案，可選擇壓縮 | Write a file, optionally compressed.
+
+    Args:
+        path (Path):
+            檔案路徑 | File path
+        data (bytes):
+            要寫入的資料 | Data to write
+        method (str):
+            壓縮方式 (為 None 時依副檔名 .zst/.gz 決定，.zst 需要 `zstandard`) | Compression method (if None, chosen by the .zst/.gz suffix; .zst requires `zstandard`)
+
+    Returns:
+        Path:
+            實際寫入的路徑 | The written path
+    """
+    path = Path(path)
+    if method is None:
+        method = {".zst": "zstd", ".gz": "gzip"}.get(path.suffix)
+    if method is not None:
+        data = compress(data, method)
+    path.write_bytes(data)
+    return path
+
+
+def read_bytes(path: Path) -> bytes:
+    """讀取檔案並自動解壓縮 | Read a file, decompressing it transparently.
+
+    Args:
+        path (Path):
+            檔案路徑 | File path
+
+    Returns:
+        bytes:
+            檔案內容 | File content
+    """
+    return decompress(Path(path).read_bytes())
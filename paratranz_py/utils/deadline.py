@@ -0,0 +1,69 @@
+import contextvars
+import time
+
+from typing import Callable, Optional
+
+_deadline = contextvars.ContextVar("paratranz_deadline", default=None)
+
+
+class Deadline:
+    """
+    整體操作的時間預算，範圍內的每個請求都會繼承剩餘時間
+    Time budget for a whole operation, inherited by every request inside it.
+
+    以 `with Deadline(60):` 使用。巢狀的期限不會超過外層期限。
+    Use as `with Deadline(60):`. A nested deadline never outlives the outer one.
+    """
+
+    def __init__(self, seconds: float):
+        """初始化期限 | Initialize the deadline.
+
+        Args:
+            seconds (float):
+                可用秒數 | Seconds available
+        """
+        self.expires_at = time.monotonic() + seconds
+        self._token = None
+
+    def remaining(self) -> float:
+        """剩餘秒數 | Seconds remaining."""
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        """是否已逾期 | Whether the deadline has passed."""
+        return self.remaining() <= 0
+
+    def __enter__(self) -> "Deadline":
+        outer = _deadline.get()
+        if outer is not None:
+            self.expires_at = min(self.expires_at, outer.expires_at)
+        self._token = _deadline.set(self)
+        return self
+
+    def __exit__(self, *exc):
+        _deadline.reset(self._token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """目前生效的期限 | The deadline in effect, if any."""
+    return _deadline.get()
+
+
+def bind_context(fn: Callable) -> Callable:
+    """讓函式在其他執行緒中沿用目前的期限 | Make a function keep the current deadline in other threads.
+
+    Args:
+        fn (Callable):
+            要在執行緒池中執行的函式 | Function to run in a thread pool
+
+    Returns:
+        Callable:
+            每次呼叫都在目前 context 的副本中執行的函式 | Function running each call in a copy of the current context
+    """
+    context = contextvars.copy_context()
+
+    def bound(*args, **kwargs):
+        return context.copy().run(fn, *args, **kwargs)
+
+    return bound
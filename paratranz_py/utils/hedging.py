@@ -0,0 +1,122 @@
+import threading
+import time
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Optional
+
+from .deadline import bind_context
+
+
+class Hedger:
+    """
+    對冪等請求送出對沖請求以降低尾端延遲
+    Hedge idempotent requests to cut tail latency.
+
+    請求超過近期延遲的指定百分位數仍未完成時，會再送出一個相同的請求，
+    並採用先成功的回應。
+    When a request is still running after the given percentile of recent
+    latencies, an identical request is sent and the first successful
+    response wins.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        window: int = 200,
+        max_workers: int = 32,
+    ):
+        """初始化對沖器 | Initialize the hedger.
+
+        Args:
+            percentile (float):
+                觸發對沖的延遲百分位數 | Latency percentile that triggers a hedge (default: 0.95)
+            initial_delay (float):
+                樣本不足時的對沖延遲秒數 | Hedge delay in seconds before enough samples exist (default: 1.0)
+            min_delay (float):
+                最短對沖延遲秒數 | Shortest hedge delay in seconds (default: 0.05)
+            window (int):
+                用於計算百分位數的樣本數 | Number of samples used for the percentile (default: 200)
+            max_workers (int):
+                執行請求的執行緒數 | Threads running the requests (default: 32)
+        """
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.hedged = 0
+        self.won = 0
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="paratranz-hedge"
+        )
+
+    def delay(self) -> float:
+        """目前的對沖延遲秒數 | Current hedge delay in seconds."""
+        with self._lock:
+            if len(self._samples) < 20:
+                return self.initial_delay
+            samples = sorted(self._samples)
+        index = min(int(len(samples) * self.percentile), len(samples) - 1)
+        return max(samples[index], self.min_delay)
+
+    def run(self, fn: Callable[[], Optional[object]]) -> Optional[object]:
+        """執行請求，必要時送出對沖請求 | Run a request, hedging it when it is slow.
+
+        Args:
+            fn (Callable):
+                送出請求的函式，失敗時回傳 None | Function sending the request, returning None on failure
+
+        Returns:
+            先成功的結果，全部失敗時為 None | The first successful result, or None if all failed
+
+        只有主要請求在對沖延遲後仍在執行時才會送出對沖請求，失敗的請求不會被重試。
+        A hedge is only sent while the primary is still running after the hedge
+        delay; failed requests are never retried.
+        """
+        fn = bind_context(fn)
+        started = threading.Event()
+        start = None
+
+        def run_primary():
+            nonlocal start
+            start = time.monotonic()
+            started.set()
+            return fn()
+
+        # 只記錄主要請求的延遲，避免對沖結果壓低百分位數
+        # Only primary latencies are sampled so hedged wins do not skew the percentile
+        def observe(future):
+            if not future.exception() and future.result() is not None:
+                with self._lock:
+                    self._samples.append(time.monotonic() - start)
+
+        primary = self._executor.submit(run_primary)
+        primary.add_done_callback(observe)
+
+        # 從主要請求實際開始時計時，在執行緒池中排隊的時間不算延遲
+        # The clock starts when the primary actually runs, time queued in the pool does not count
+        started.wait()
+        done, _ = wait(
+            [primary], timeout=max(self.delay() - (time.monotonic() - start), 0)
+        )
+        if done:
+            # 已完成的請求 (包含失敗) 不會再送出 | A finished request, even a failed one, is not resent
+            return primary.result()
+
+        with self._lock:
+            self.hedged += 1
+        hedge = self._executor.submit(fn)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result is not None:
+                    if future is hedge:
+                        with self._lock:
+                            self.won += 1
+                    return result
+        return None
@@ -0,0 +1,51 @@
+from loguru import logger
+from typing import Callable, Iterator
+
+from .deadline import current_deadline
+
+
+def iter_pages(
+    fetch: Callable[..., dict],
+    *args,
+    page_size: int = 50,
+    start_page: int = 1,
+    **kwargs,
+) -> Iterator[dict]:
+    """逐頁迭代分頁 API 的回應 | Iterate over the pages of a paginated API.
+
+    在 `Deadline` 範圍內呼叫時，期限到了就會停止。
+    Stops once the enclosing `Deadline`, if any, has passed.
+
+    Args:
+        fetch (Callable):
+            分頁 API 方法，例如 `History.get_history` | Paginated API method, e.g. `History.get_history`
+        args:
+            傳給 `fetch` 的位置參數 | Positional arguments passed to `fetch`
+        page_size (int):
+            每頁數量 | Number of items per page (default: 50)
+        start_page (int):
+            起始頁碼 | Page number to start from (default: 1)
+        kwargs:
+            傳給 `fetch` 的其他參數 | Other keyword arguments passed to `fetch`
+
+    Yields:
+        dict:
+            單頁回應 (包含 `results`、`page` 與 `pageCount`) | A single page response (with `results`, `page` and `pageCount`)
+    """
+    page = start_page
+    while True:
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired:
+            logger.error(f"Deadline exceeded at page {page} of {fetch.__name__}.")
+            return
+
+        data = fetch(*args, page=page, page_size=page_size, **kwargs)
+        if not isinstance(data, dict):
+            logger.error(f"Failed to fetch page {page} from {fetch.__name__}.")
+            return
+
+        yield data
+
+        if page >= data.get("pageCount", 0):
+            return
+        page += 1
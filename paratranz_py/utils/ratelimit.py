@@ -0,0 +1,41 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    執行緒安全的令牌桶限速器
+    Thread-safe token bucket rate limiter.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """初始化限速器 | Initialize the rate limiter.
+
+        Args:
+            rate (float):
+                每秒允許的請求數 | Requests allowed per second
+            burst (int):
+                可瞬間突發的請求數 | Number of requests allowed in a burst (default: 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """等待直到取得一個令牌 | Block until a token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
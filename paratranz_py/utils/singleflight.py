@@ -0,0 +1,95 @@
+import asyncio
+import threading
+
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    合併相同且同時進行中的呼叫 (執行緒版本)
+    Coalesce identical concurrent calls (thread version).
+
+    同一個 key 在進行中時，其他呼叫者會等待並取得同一個結果。
+    While a call for a key is in flight, other callers wait for it and
+    receive the same result.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """執行或等待進行中的呼叫 | Run the call, or wait for the one in flight.
+
+        Args:
+            key (Hashable):
+                呼叫的識別鍵 | Key identifying the call
+            fn (Callable):
+                實際執行的函式 | Function doing the actual work
+
+        Returns:
+            Any:
+                `fn` 的回傳值 | The return value of `fn`
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    合併相同且同時進行中的呼叫 (asyncio 版本)
+    Coalesce identical concurrent calls (asyncio version).
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """執行或等待進行中的呼叫 | Run the call, or wait for the one in flight.
+
+        Args:
+            key (Hashable):
+                呼叫的識別鍵 | Key identifying the call
+            fn (Callable):
+                回傳 awaitable 的函式 | Function returning an awaitable
+
+        Returns:
+            Any:
+                `fn` 的結果 | The result of `fn`
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._calls[key] = future
+            future.add_done_callback(lambda _: self._calls.pop(key, None))
+        # shield 讓單一呼叫者取消時不影響其他等待者 | shield keeps one cancelled waiter from cancelling the rest
+        return await asyncio.shield(future)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
@@ -0,0 +1,94 @@
+import zipfile
+
+from pathlib import Path
+from loguru import logger
+from typing import List, NamedTuple
+
+
+class ArchiveDelta(NamedTuple):
+    """
+    兩個 ZIP 檔之間的差異
+    Difference between two ZIP archives.
+    """
+
+    added: List[str]
+    modified: List[str]
+    removed: List[str]
+    unchanged: int = 0
+
+
+def _entries(path: Path) -> dict:
+    # 只讀取中央目錄，不會解壓縮任何內容 | Reads the central directory only, nothing is decompressed
+    with zipfile.ZipFile(path) as archive:
+        return {
+            info.filename: (info.file_size, info.CRC)
+            for info in archive.infolist()
+            if not info.is_dir()
+        }
+
+
+def diff_archives(old: Path, new: Path) -> ArchiveDelta:
+    """依中央目錄的名稱、大小與 CRC32 比較兩個 ZIP 檔 | Compare two ZIP archives by the names, sizes and CRC32 in their central directories.
+
+    Args:
+        old (Path):
+            先前的 ZIP 檔 (為 None 或不存在時視為空) | The previous archive (treated as empty if None or missing)
+        new (Path):
+            新的 ZIP 檔 | The new archive
+
+    Returns:
+        ArchiveDelta:
+            新增、修改與移除的檔案名稱 | Names of the added, modified and removed files
+    """
+    before = _entries(old) if old is not None and Path(old).exists() else {}
+    after = _entries(new)
+
+    added = sorted(name for name in after if name not in before)
+    modified = sorted(
+        name for name in after if name in before and after[name] != before[name]
+    )
+    removed = sorted(name for name in before if name not in after)
+    unchanged = len(after) - len(added) - len(modified)
+    return ArchiveDelta(added, modified, removed, unchanged)
+
+
+def apply_delta(
+    archive: Path, delta: ArchiveDelta, extract_path: Path, prune: bool = False
+) -> ArchiveDelta:
+    """只解壓縮新增與修改的檔案 | Extract only the added and modified files.
+
+    Args:
+        archive (Path):
+            新的 ZIP 檔 | The new archive
+        delta (ArchiveDelta):
+            `diff_archives` 的結果 | Result of `diff_archives`
+        extract_path (Path):
+            解壓縮路徑 | Extract path
+        prune (bool):
+            刪除已移除的檔案 | Delete the removed files (default: False)
+
+    Returns:
+        ArchiveDelta:
+            傳入的差異 | The given delta
+    """
+    extract_path = Path(extract_path)
+    extract_path.mkdir(parents=True, exist_ok=True)
+
+    with zipfile.ZipFile(archive) as zip_file:
+        for name in delta.added + delta.modified:
+            zip_file.extract(name, extract_path)
+
+    if prune:
+        root = extract_path.resolve()
+        for name in delta.removed:
+            target = (extract_path / name).resolve()
+            if root not in target.parents:
+                logger.warning(f"Skipped removing {name} outside {extract_path}.")
+                continue
+            target.unlink(missing_ok=True)
+
+    logger.info(
+        f"Extracted {len(delta.added)} added and {len(delta.modified)} modified files, "
+        f"{len(delta.removed)} removed, {delta.unchanged} unchanged."
+    )
+    return delta
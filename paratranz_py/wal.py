@@ -0,0 +1,397 @@
+import base64
+import json
+import sqlite3
+import threading
+import time
+
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from loguru import logger
+from typing import TYPE_CHECKING
+
+from .utils.adaptive import pool_size
+from .utils.deadline import bind_context, current_deadline
+
+if TYPE_CHECKING:
+    from .api.base import ParaTranzAPI
+
+
+class WriteAheadQueue:
+    """
+    持久化的寫入預寫佇列，讓修改請求在離線時不會遺失
+    Durable write-ahead queue so mutations survive when ParaTranz is unreachable.
+
+    每個修改請求 (POST、PUT、DELETE) 會先寫入 SQLite，成功送出後才移除。
+    同一網址上尚未送出的 PUT 會併入較新的 PUT，或被 DELETE 取代。
+    正在送出的項目會被租用，租約到期前 `replay` 不會重送；同一網址的請求一次只送出一個。
+    Every mutation (POST, PUT, DELETE) is written to SQLite first and removed
+    once it has been sent. Pending PUTs are merged into a newer PUT to the
+    same URL, or superseded by a DELETE. Entries being sent are leased, and
+    `replay` does not resend them until the lease expires. Only one request
+    per URL is in flight at a time.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        deferred: bool = False,
+        max_attempts: int = 5,
+        lease: float = 60,
+    ):
+        """初始化佇列 | Initialize the queue.
+
+        Args:
+            path (Path):
+                SQLite 檔案路徑 | SQLite file path
+            deferred (bool):
+                只記錄而不立即送出，交由 `replay` 或背景工作送出 (此時 API 方法回傳 None) |
+                Only record mutations and leave sending to `replay` or the background
+                worker (API methods then return None) (default: False)
+            max_attempts (int):
+                伺服器或網路錯誤重送幾次後放棄 | Give up after this many replays failed by server or network errors (default: 5)
+            lease (float):
+                送出中的項目多久後可被重送 (秒)，應大於請求逾時 | Seconds before an entry being sent may be replayed, longer than the request timeout (default: 60)
+        """
+        self.deferred = deferred
+        self.max_attempts = max_attempts
+        self.lease = lease
+        self._lock = threading.Lock()
+        # 項目送出完成或釋放時通知等待同一網址的請求 | Wakes requests waiting on the same URL when an entry finishes
+        self._changed = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._worker = None
+
+        self._db = sqlite3.connect(Path(path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS mutations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                method TEXT NOT NULL,
+                url TEXT NOT NULL,
+                kwargs TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                failed INTEGER NOT NULL DEFAULT 0,
+                leased_until REAL NOT NULL DEFAULT 0
+            )
+            """
+        )
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(mutations)")]
+        if "leased_until" not in columns:
+            self._db.execute(
+                "ALTER TABLE mutations ADD COLUMN leased_until REAL NOT NULL DEFAULT 0"
+            )
+        self._db.commit()
+
+    def append(self, method: str, url: str, kwargs: dict) -> int:
+        """記錄一個修改請求 | Record a mutation.
+
+        上傳用的檔案物件會被讀取並以 (檔名, 位元組) 取代，以便之後重送。
+        被取代的 PUT 中非 None 的 json 欄位會併入 `kwargs`，避免部分更新遺失。
+        立即送出時項目會被租用，送出後須呼叫 `ack` 或 `release`。
+        File objects to upload are read and replaced in place with
+        (file name, bytes) so the request can be replayed later. Non-None json
+        fields of superseded PUTs are merged into `kwargs` in place, so partial
+        updates are not lost. Unless the queue is deferred, the entry is leased
+        for the caller, who should `wait_turn` before sending and then `ack` or
+        `release` it.
+
+        Args:
+            method (str):
+                HTTP 方法 | HTTP method
+            url (str):
+                請求網址 | Request URL
+            kwargs (dict):
+                `requests` 參數 | `requests` parameters
+
+        Returns:
+            int:
+                佇列項目 ID | Queue entry ID
+        """
+        method = method.upper()
+        if "files" in kwargs:
+            kwargs["files"] = {
+                field: _read_upload(upload) for field, upload in kwargs["files"].items()
+            }
+
+        now = time.time()
+        with self._lock, self._db:
+            if method in ("PUT", "DELETE"):
+                # 送出中的 PUT 不會被取代，新的請求會以 `wait_turn` 等它完成
+                # PUTs being sent are left alone, the new request waits for them in `wait_turn`
+                superseded = self._db.execute(
+                    "SELECT id, kwargs FROM mutations WHERE method = 'PUT' AND url = ?"
+                    " AND failed = 0 AND leased_until <= ? ORDER BY id",
+                    (url, now),
+                ).fetchall()
+                if method == "PUT" and isinstance(kwargs.get("json"), dict):
+                    merged = {}
+                    for _, previous in superseded:
+                        body = json.loads(previous).get("json")
+                        if isinstance(body, dict):
+                            merged.update(
+                                (key, value)
+                                for key, value in body.items()
+                                if value is not None
+                            )
+                    for key, value in kwargs["json"].items():
+                        if value is not None or key not in merged:
+                            merged[key] = value
+                    kwargs["json"] = merged
+                self._db.executemany(
+                    "DELETE FROM mutations WHERE id = ?",
+                    [(entry_id,) for entry_id, _ in superseded],
+                )
+            cursor = self._db.execute(
+                "INSERT INTO mutations (method, url, kwargs, leased_until)"
+                " VALUES (?, ?, ?, ?)",
+                (
+                    method,
+                    url,
+                    _dump_kwargs(kwargs),
+                    0 if self.deferred else now + self.lease,
+                ),
+            )
+            return cursor.lastrowid
+
+    def ack(self, entry_id: int):
+        """移除已成功送出的項目 | Remove an entry that was sent successfully.
+
+        Args:
+            entry_id (int):
+                佇列項目 ID | Queue entry ID
+        """
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM mutations WHERE id = ?", (entry_id,))
+            self._changed.notify_all()
+
+    def release(self, entry_id: int):
+        """釋放送出失敗的項目，交由 `replay` 重送 | Release an entry that failed to send, leaving it to `replay`.
+
+        Args:
+            entry_id (int):
+                佇列項目 ID | Queue entry ID
+        """
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE mutations SET leased_until = 0 WHERE id = ?", (entry_id,)
+            )
+            self._changed.notify_all()
+
+    def wait_turn(self, entry_id: int, url: str, timeout: float = None):
+        """等待同一網址上較早且送出中的項目完成 | Wait for earlier entries to the same URL that are being sent.
+
+        同一網址的請求因此不會同時送出，較舊的寫入不會覆蓋較新的寫入。
+        最多等到租約到期或 `timeout`。
+        Requests to one URL are therefore never in flight together, so an
+        older write cannot land after a newer one. Waits at most until the
+        lease expires or `timeout` passes.
+
+        Args:
+            entry_id (int):
+                佇列項目 ID | Queue entry ID
+            url (str):
+                請求網址 | Request URL
+            timeout (float):
+                最長等待秒數 | Longest wait in seconds (default: None, the lease)
+        """
+        give_up = time.monotonic() + (self.lease if timeout is None else timeout)
+        with self._changed:
+            while True:
+                now = time.time()
+                (leased_until,) = self._db.execute(
+                    "SELECT MAX(leased_until) FROM mutations WHERE url = ? AND id < ?"
+                    " AND failed = 0 AND leased_until > ?",
+                    (url, entry_id, now),
+                ).fetchone()
+                wait = min((leased_until or now) - now, give_up - time.monotonic())
+                if wait <= 0:
+                    return
+                # 其他行程的更新不會通知，定期重新檢查 | Other processes do not notify, so poll as well
+                self._changed.wait(min(wait, 1.0))
+
+    def _claim(self, entry_id: int, url: str) -> bool:
+        # 同一網址有其他送出中的項目時不領取 | Not claimed while another entry to the URL is in flight
+        now = time.time()
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "UPDATE mutations SET leased_until = ?"
+                " WHERE id = ? AND failed = 0 AND leased_until <= ? AND NOT EXISTS ("
+                "SELECT 1 FROM mutations WHERE url = ? AND id != ?"
+                " AND failed = 0 AND leased_until > ?)",
+                (now + self.lease, entry_id, now, url, entry_id, now),
+            )
+            return cursor.rowcount == 1
+
+    def pending(self) -> list:
+        """列出尚未送出的項目 | List entries that have not been sent.
+
+        Returns:
+            list:
+                (ID, 方法, 網址) | (ID, method, URL)
+        """
+        with self._lock:
+            return self._db.execute(
+                "SELECT id, method, url FROM mutations WHERE failed = 0 ORDER BY id"
+            ).fetchall()
+
+    def replay(self, api: "ParaTranzAPI", max_workers: int = 4) -> dict:
+        """重送所有尚未送出的項目 | Replay every pending entry.
+
+        不同網址的請求會並行送出，同一網址的請求依記錄順序送出。
+        送出中的項目會被略過；目前的 `Deadline` 到期時會提前停止。
+        只有伺服器或網路錯誤會計入重試次數，4xx 錯誤會直接放棄。
+        Requests to different URLs are sent concurrently, while requests to
+        the same URL keep their recorded order. Entries being sent elsewhere
+        are skipped, and replay stops early once the current `Deadline` has
+        passed. Only server and network errors count as attempts; a 4xx
+        rejection gives up at once.
+
+        Args:
+            api (ParaTranzAPI):
+                用來送出請求的 API 實例，例如 `client.strings` | API instance used to send, e.g. `client.strings`
+            max_workers (int):
+                同時送出的請求數，設定限制器時由限制器決定 | Number of concurrent requests, decided by the limiter when one is set (default: 4)
+
+        Returns:
+            dict:
+                成功、重試與放棄的數量 | Counts of sent, retried and failed entries
+        """
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired:
+            logger.warning("Deadline exceeded, write-ahead queue not replayed.")
+            return {"sent": 0, "retried": 0, "failed": 0}
+
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, method, url, kwargs, attempts FROM mutations"
+                " WHERE failed = 0 ORDER BY id"
+            ).fetchall()
+
+        groups = defaultdict(list)
+        for row in rows:
+            groups[row[2]].append(row)
+
+        @bind_context
+        def replay_group(group: list) -> Counter:
+            counts = Counter()
+            for entry_id, method, url, kwargs, attempts in group:
+                # 送出中或已逾期時停止，以保留同一網址的順序
+                # Stop when in flight or out of time, keeping the order per URL
+                if deadline is not None and deadline.expired:
+                    break
+                if not self._claim(entry_id, url):
+                    break
+
+                response, status = api._exchange(method, url, **_load_kwargs(kwargs))
+                if response is not None:
+                    self.ack(entry_id)
+                    counts["sent"] += 1
+                    continue
+
+                if deadline is not None and deadline.expired:
+                    self.release(entry_id)
+                    break
+
+                rejected = (
+                    status is not None and status < 500 and status not in (408, 429)
+                )
+                if not rejected:
+                    attempts += 1
+                failed = rejected or attempts >= self.max_attempts
+                with self._lock, self._db:
+                    self._db.execute(
+                        "UPDATE mutations SET attempts = ?, failed = ?, leased_until = 0"
+                        " WHERE id = ?",
+                        (attempts, int(failed), entry_id),
+                    )
+                    self._changed.notify_all()
+                if rejected:
+                    logger.error(
+                        f"Giving up on {method} {url}, rejected with {status}."
+                    )
+                    counts["failed"] += 1
+                elif failed:
+                    logger.error(f"Giving up on {method} {url} after {attempts} tries.")
+                    counts["failed"] += 1
+                else:
+                    counts["retried"] += 1
+                break
+            return counts
+
+        summary = {"sent": 0, "retried": 0, "failed": 0}
+        workers = pool_size(api._limiter, max_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for counts in executor.map(replay_group, groups.values()):
+                for key, count in counts.items():
+                    summary[key] += count
+
+        if rows:
+            logger.info(f"Replayed write-ahead queue: {summary}")
+        return summary
+
+    def start_worker(
+        self, api: "ParaTranzAPI", interval: float = 30, max_workers: int = 4
+    ) -> threading.Thread:
+        """啟動背景重送工作 | Start the background replay worker.
+
+        Args:
+            api (ParaTranzAPI):
+                用來送出請求的 API 實例 | API instance used to send requests
+            interval (float):
+                每次重送的間隔秒數 | Seconds between replays (default: 30)
+            max_workers (int):
+                同時送出的請求數，設定限制器時由限制器決定 | Number of concurrent requests, decided by the limiter when one is set (default: 4)
+
+        Returns:
+            threading.Thread:
+                背景執行緒 | The background thread
+        """
+
+        def run():
+            while not self._stop.is_set():
+                self.replay(api, max_workers=max_workers)
+                self._stop.wait(interval)
+
+        self._stop.clear()
+        self._worker = threading.Thread(
+            target=run, name="paratranz-wal-replay", daemon=True
+        )
+        self._worker.start()
+        return self._worker
+
+    def close(self):
+        """停止背景工作並關閉佇列 | Stop the background worker and close the queue."""
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+        self._db.close()
+
+
+def _read_upload(upload) -> tuple:
+    if isinstance(upload, tuple):
+        return upload
+    with upload:
+        return Path(getattr(upload, "name", "file")).name, upload.read()
+
+
+def _dump_kwargs(kwargs: dict) -> str:
+    kwargs = dict(kwargs)
+    if "files" in kwargs:
+        kwargs["files"] = {
+            field: [name, base64.b64encode(content).decode("ascii")]
+            for field, (name, content) in kwargs["files"].items()
+        }
+    return json.dumps(kwargs, ensure_ascii=False)
+
+
+def _load_kwargs(text: str) -> dict:
+    kwargs = json.loads(text)
+    if "files" in kwargs:
+        kwargs["files"] = {
+            field: (name, base64.b64decode(content))
+            for field, (name, content) in kwargs["files"].items()
+        }
+    return kwargs